@@ -12,6 +12,7 @@ Timeout: Default 3s using httpx
 """
 
 import asyncio
+import contextlib
 import logging
 import random
 import time
@@ -250,6 +251,7 @@ async def post_step(
     payload: dict,
     timeout: float = DEFAULT_TIMEOUT,
     use_mock: bool | None = None,
+    client: "httpx.AsyncClient | None" = None,
 ) -> GMResponse:
     """Post a step to the GM service.
 
@@ -257,6 +259,8 @@ async def post_step(
         payload: Step payload containing utterance, speaker, world_state
         timeout: Timeout in seconds (default: 3s)
         use_mock: If True, use mock. If None, auto-detect GM availability.
+        client: Shared AsyncClient to reuse pooled connections. If None,
+            a client is created (and closed) for this call.
 
     Returns:
         GMResponse with actions, world_patch, and logs
@@ -295,8 +299,12 @@ async def post_step(
                 f"GM post_step timed out after {elapsed_ms}ms (limit: {int(timeout * 1000)}ms)"
             )
 
-    # Real HTTP implementation
-    async with httpx.AsyncClient(timeout=timeout) as client:
+    # Real HTTP implementation (a caller-owned client is left open)
+    if client is not None:
+        client_cm = contextlib.nullcontext(client)
+    else:
+        client_cm = httpx.AsyncClient(timeout=timeout)
+    async with client_cm as client:
         try:
             # Build GMStepRequest-compatible payload
             speaker = payload.get("speaker", "やな")
@@ -402,6 +410,7 @@ async def post_step(
             response = await client.post(
                 f"{GM_BASE_URL}/v1/gm/step",
                 json=gm_request,
+                timeout=timeout,
             )
             response.raise_for_status()
             data = response.json()
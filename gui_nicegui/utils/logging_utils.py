@@ -8,21 +8,28 @@ import uuid
 from datetime import datetime
 from typing import Callable
 
+# Pre-bound log line formatters (template parsed once at import)
+# Format: [HH:MM:SS.mmm] [trace_id] [phase] message(latency)
+_LOG_FMT = "[{}] [{}] [{}] {}{}".format
+_LOG_FMT_NO_TRACE = "[{}] [{}] {}".format
+
 
 class TraceContext:
     """Context for tracing a single One-Step execution."""
 
+    __slots__ = ("trace_id", "speaker", "turn_number", "start_time", "events")
+
     def __init__(self, speaker: str, turn_number: int):
         self.trace_id = uuid.uuid4().hex[:8]
         self.speaker = speaker
         self.turn_number = turn_number
-        self.start_time = time.perf_counter()
+        self.start_time = time.perf_counter_ns()
         self.events: list[dict] = []
 
     def log_event(self, phase: str, message: str, latency_ms: int | None = None) -> str:
         """Log an event and return formatted log string."""
         timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        elapsed_ms = int((time.perf_counter() - self.start_time) * 1000)
+        elapsed_ms = (time.perf_counter_ns() - self.start_time) // 1_000_000
 
         event = {
             "timestamp": timestamp,
@@ -35,11 +42,11 @@ class TraceContext:
 
         # Format: [HH:MM:SS.mmm] [trace_id] [phase] message (latency/elapsed)
         latency_str = f" ({latency_ms}ms)" if latency_ms else ""
-        return f"[{timestamp}] [{self.trace_id}] [{phase}] {message}{latency_str}"
+        return _LOG_FMT(timestamp, self.trace_id, phase, message, latency_str)
 
     def get_summary(self) -> dict:
         """Get trace summary for reporting."""
-        total_elapsed = int((time.perf_counter() - self.start_time) * 1000)
+        total_elapsed = (time.perf_counter_ns() - self.start_time) // 1_000_000
         return {
             "trace_id": self.trace_id,
             "speaker": self.speaker,
@@ -53,22 +60,29 @@ class TraceContext:
 class LogBuffer:
     """Buffer for accumulating log lines with optional callback."""
 
+    __slots__ = ("lines", "max_lines", "callback", "_joined")
+
     def __init__(self, max_lines: int = 100, callback: Callable[[str], None] | None = None):
         self.lines: list[str] = []
         self.max_lines = max_lines
         self.callback = callback
+        # Cached "\n".join(lines); None when invalidated by append/clear
+        self._joined: str | None = None
 
     def append(self, line: str) -> None:
         """Append a log line."""
         self.lines.append(line)
         if len(self.lines) > self.max_lines:
             self.lines = self.lines[-self.max_lines:]
+        self._joined = None
         if self.callback:
             self.callback(line)
 
     def get_all(self) -> str:
         """Get all log lines as a single string."""
-        return "\n".join(self.lines)
+        if self._joined is None:
+            self._joined = "\n".join(self.lines)
+        return self._joined
 
     def get_last(self, n: int = 1) -> str:
         """Get last N log lines."""
@@ -77,6 +91,7 @@ class LogBuffer:
     def clear(self) -> None:
         """Clear all log lines."""
         self.lines.clear()
+        self._joined = None
 
 
 def format_timestamp() -> str:
@@ -88,5 +103,5 @@ def format_log_line(phase: str, message: str, trace_id: str | None = None) -> st
     """Format a log line with timestamp and optional trace ID."""
     timestamp = format_timestamp()
     if trace_id:
-        return f"[{timestamp}] [{trace_id}] [{phase}] {message}"
-    return f"[{timestamp}] [{phase}] {message}"
+        return _LOG_FMT(timestamp, trace_id, phase, message, "")
+    return _LOG_FMT_NO_TRACE(timestamp, phase, message)
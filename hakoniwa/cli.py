@@ -9,22 +9,40 @@ Commands:
 import json
 import sys
 from pathlib import Path
+from typing import Any
 
 import click
 
 from hakoniwa import __version__
-from hakoniwa.config import (
-    HakoniwaConfig,
-    get_config_hash,
-    get_health_summary,
-    load_config,
-    validate_config,
-)
-from hakoniwa.persistence import load_dry_run, load_world_state
-from hakoniwa.serializer.canonical import compute_hash
+
+# NOTE: hakoniwa.config / persistence / serializer pull in pydantic and yaml.
+# They are imported inside the commands that need them so that `--help`,
+# `--version` and unrelated commands start quickly.
+
+# Try to import orjson for faster JSON handling, fall back to stdlib json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Supported schema versions for PlayState
-SUPPORTED_SCHEMA_VERSIONS = ["1.0.0"]
+SUPPORTED_SCHEMA_VERSIONS = ["1.0.0", "1.1.0"]
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_pretty(obj: Any) -> str:
+    """Serialize to 2-space indented JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
 
 
 def _diagnose_hash_mismatch(content: str) -> str:
@@ -69,28 +87,39 @@ def _validate_play_state(path: Path) -> tuple[bool, list[str], dict | None]:
     Returns:
         Tuple of (is_valid, errors, data if valid)
     """
+    from hakoniwa.serializer.canonical import compute_hash
+
     errors: list[str] = []
 
-    if not path.exists():
+    # Open directly instead of exists() + read (one syscall path per file)
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
         return False, [f"File not found: {path}"], None
+    except OSError as e:
+        return False, [f"Failed to read: {e}"], None
 
     # Check hash file
     hash_path = Path(str(path) + ".sha256")
-    if not hash_path.exists():
+    try:
+        expected_raw = hash_path.read_bytes()
+    except FileNotFoundError:
         return False, [f"Hash file not found: {hash_path}"], None
+    except OSError as e:
+        return False, [f"Failed to read: {e}"], None
 
-    # Read and verify hash
+    # Verify hash
     try:
-        content = path.read_text(encoding="utf-8")
-        expected_hash = hash_path.read_text(encoding="utf-8").strip()
-        actual_hash = compute_hash(content)
+        # Hash raw bytes so the happy path never decodes to str
+        expected_hash = expected_raw.strip().decode("ascii")
+        actual_hash = compute_hash(raw)
 
         if actual_hash != expected_hash:
             # Hash mismatch - run diagnostics to determine cause
-            detail = _diagnose_hash_mismatch(content)
+            detail = _diagnose_hash_mismatch(raw.decode("utf-8", errors="replace"))
             return False, ["Hash mismatch", f"Detail: {detail}"], None
 
-        data = json.loads(content)
+        data = _json_loads(raw)
 
         # Check PlayState required fields
         required = ["schema_version", "scenario_name", "current_location", "holding"]
@@ -127,21 +156,19 @@ def config_validate(config_path: str):
 
     CONFIG_PATH: Path to YAML config file
     """
+    from hakoniwa.config import get_config_hash, validate_config
+
     path = Path(config_path)
 
-    is_valid, errors = validate_config(path)
+    is_valid, errors, loaded_config = validate_config(path)
 
-    if is_valid:
+    if is_valid and loaded_config:
         click.echo(click.style("✓ Config OK", fg="green"))
 
-        # Show loaded config summary
-        try:
-            loaded_config = load_config(path)
-            click.echo(f"  config_hash: {get_config_hash(loaded_config)}")
-            click.echo(f"  llm_backend: {loaded_config.llm_backend}")
-            click.echo(f"  llm_model: {loaded_config.llm_model}")
-        except Exception:
-            pass
+        # Show loaded config summary (reuses the model built during validation)
+        click.echo(f"  config_hash: {get_config_hash(loaded_config)}")
+        click.echo(f"  llm_backend: {loaded_config.llm_backend}")
+        click.echo(f"  llm_model: {loaded_config.llm_model}")
 
         sys.exit(0)
     else:
@@ -171,30 +198,30 @@ def up(config_path: str | None, output_json: bool):
 
     Validates config and displays system status.
     """
+    from hakoniwa.config import get_config_hash, get_health_summary, load_config
+
     # Load config
     path = Path(config_path) if config_path else None
     loaded_config = load_config(path)
 
-    # Get health summary
-    summary = get_health_summary(loaded_config)
-
     if output_json:
-        click.echo(json.dumps(summary, indent=2, ensure_ascii=False))
+        click.echo(_json_dumps_pretty(get_health_summary(loaded_config)))
     else:
+        # Read fields straight off the config; no intermediate summary dict
         click.echo(click.style("HAKONIWA Health Summary", fg="cyan", bold=True))
         click.echo()
-        click.echo(f"  status:      {click.style(summary['status'], fg='green')}")
-        click.echo(f"  config_hash: {summary['config_hash']}")
+        click.echo(f"  status:      {click.style('OK', fg='green')}")
+        click.echo(f"  config_hash: {get_config_hash(loaded_config)}")
         click.echo()
         click.echo("  LLM Settings:")
-        click.echo(f"    backend:   {summary['llm_backend']}")
-        click.echo(f"    model:     {summary['llm_model']}")
-        click.echo(f"    base_url:  {summary['llm_base_url']}")
+        click.echo(f"    backend:   {loaded_config.llm_backend}")
+        click.echo(f"    model:     {loaded_config.llm_model}")
+        click.echo(f"    base_url:  {loaded_config.llm_base_url}")
         click.echo()
         click.echo("  Session Settings:")
-        click.echo(f"    max_turns:   {summary['max_turns']}")
-        click.echo(f"    max_retries: {summary['max_retries']}")
-        click.echo(f"    results_dir: {summary['results_dir']}")
+        click.echo(f"    max_turns:   {loaded_config.max_turns}")
+        click.echo(f"    max_retries: {loaded_config.max_retries}")
+        click.echo(f"    results_dir: {loaded_config.results_dir}")
 
 
 @cli.command("load")
@@ -218,35 +245,33 @@ def load(state_path: str, dry_run: bool):
     With --dry-run: Validates file integrity and schema compatibility.
     Without --dry-run: Loads and displays state summary.
     """
+    from hakoniwa.persistence import load_dry_run, try_load_world_state
+
     path = Path(state_path)
 
     # First try WorldStateDTO format
-    is_valid, errors = load_dry_run(path)
-
-    if is_valid:
-        # WorldStateDTO format
-        if dry_run:
+    if dry_run:
+        is_valid, errors = load_dry_run(path)
+        if is_valid:
             click.echo(click.style("✓ State OK (WorldStateDTO)", fg="green"))
             click.echo(f"  path: {path}")
             click.echo(f"  format: WorldStateDTO")
             click.echo(f"  schema_version: 1.0.0")
             sys.exit(0)
-        else:
-            try:
-                state = load_world_state(path)
-                click.echo(click.style("HAKONIWA State Loaded", fg="cyan", bold=True))
-                click.echo()
-                click.echo(f"  session_id:     {state.manifest.session_id}")
-                click.echo(f"  schema_version: {state.manifest.schema_version}")
-                click.echo(f"  scenario_id:    {state.scenario_id}")
-                click.echo(f"  turn_count:     {len(state.history)}")
-                click.echo(f"  created_at:     {state.manifest.created_at.isoformat()}")
-                if state.manifest.modified_at:
-                    click.echo(f"  modified_at:    {state.manifest.modified_at.isoformat()}")
-                sys.exit(0)
-            except Exception as e:
-                click.echo(click.style(f"✗ Load failed: {e}", fg="red"))
-                sys.exit(1)
+    else:
+        # Validate and load in a single pass (no separate dry run)
+        state, errors = try_load_world_state(path)
+        if state is not None:
+            click.echo(click.style("HAKONIWA State Loaded", fg="cyan", bold=True))
+            click.echo()
+            click.echo(f"  session_id:     {state.manifest.session_id}")
+            click.echo(f"  schema_version: {state.manifest.schema_version}")
+            click.echo(f"  scenario_id:    {state.scenario_id}")
+            click.echo(f"  turn_count:     {len(state.history)}")
+            click.echo(f"  created_at:     {state.manifest.created_at.isoformat()}")
+            if state.manifest.modified_at:
+                click.echo(f"  modified_at:    {state.manifest.modified_at.isoformat()}")
+            sys.exit(0)
 
     # Try PlayState format (from play_mode)
     is_valid_play, errors_play, play_data = _validate_play_state(path)
@@ -7,6 +7,12 @@ import yaml
 
 from hakoniwa.config.schema import HakoniwaConfig
 
+# Prefer libyaml C loader, fall back to pure-Python SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 def load_config(path: Path | None = None) -> HakoniwaConfig:
     """Load config from YAML file or return defaults.
@@ -17,43 +23,42 @@ def load_config(path: Path | None = None) -> HakoniwaConfig:
     Returns:
         Loaded HakoniwaConfig
     """
-    if path is None or not path.exists():
+    if path is None:
         return HakoniwaConfig()
 
-    content = path.read_text(encoding="utf-8")
-    data = yaml.safe_load(content) or {}
+    try:
+        with path.open("rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+    except FileNotFoundError:
+        return HakoniwaConfig()
 
     return HakoniwaConfig(**data)
 
 
-def validate_config(path: Path) -> tuple[bool, list[str]]:
+def validate_config(path: Path) -> tuple[bool, list[str], HakoniwaConfig | None]:
     """Validate config file.
 
     Args:
         path: Path to config file
 
     Returns:
-        Tuple of (is_valid, list of errors)
+        Tuple of (is_valid, list of errors, loaded config if valid)
     """
-    errors: list[str] = []
-
-    if not path.exists():
-        return False, [f"Config file not found: {path}"]
-
     try:
-        content = path.read_text(encoding="utf-8")
-        data = yaml.safe_load(content)
+        with path.open("rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
 
         if data is None:
             data = {}
 
-        HakoniwaConfig(**data)
-        return True, []
+        return True, [], HakoniwaConfig(**data)
 
+    except FileNotFoundError:
+        return False, [f"Config file not found: {path}"], None
     except yaml.YAMLError as e:
-        return False, [f"Invalid YAML: {e}"]
+        return False, [f"Invalid YAML: {e}"], None
     except Exception as e:
-        return False, [str(e)]
+        return False, [str(e)], None
 
 
 def get_config_hash(config: HakoniwaConfig) -> str:
@@ -3,8 +3,10 @@
 The manifest contains metadata about the saved world state.
 """
 
-import uuid
-from datetime import datetime
+import os
+import time
+from datetime import datetime, timezone
+from functools import partial
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -15,8 +17,9 @@ CURRENT_SCHEMA_VERSION = "1.0.0"
 
 def _generate_session_id() -> str:
     """Generate a unique session ID."""
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    unique_id = uuid.uuid4().hex[:8]
+    # time.gmtime avoids building a datetime (and the deprecated utcnow)
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+    unique_id = os.urandom(4).hex()
     return f"hakoniwa_{timestamp}_{unique_id}"
 
 
@@ -43,7 +46,7 @@ class Manifest(BaseModel):
 
     # Creation timestamp
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=partial(datetime.now, timezone.utc),
         description="Timestamp when state was created",
     )
 
@@ -9,22 +9,33 @@ Key principles:
 - Runtime state tracks current position for resume
 """
 
-from datetime import datetime
-from typing import Literal
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from hakoniwa.config.schema import HakoniwaConfig
 from hakoniwa.dto.manifest import Manifest
+from hakoniwa.serializer.canonical import orjson_floats_match
+
+
+def _datetime_to_json(value: datetime) -> str:
+    """Format datetime like pydantic's JSON mode (zero UTC offset -> "Z")."""
+    text = value.isoformat()
+    if text.endswith("+00:00"):
+        return text[:-6] + "Z"
+    return text
 
 
 class TurnRecord(BaseModel):
     """Record of a single turn in the conversation.
 
     This is the confirmed past - once saved, it should not be modified.
+    Frozen: records are hashable and safe to share between states.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     # Turn identification
     turn_index: int = Field(
@@ -63,10 +74,56 @@ class TurnRecord(BaseModel):
 
     # Timestamp
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=partial(datetime.now, timezone.utc),
         description="When this turn was generated",
     )
 
+    # Cached JSON-mode dump and its orjson float check (fields are frozen,
+    # so neither goes stale)
+    _canonical_cache: dict[str, Any] | None = PrivateAttr(default=None)
+    _floats_match_cache: bool | None = PrivateAttr(default=None)
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> "TurnRecord":
+        """Copy the record; updated copies drop the inherited caches."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__pydantic_private__["_canonical_cache"] = None
+            copied.__pydantic_private__["_floats_match_cache"] = None
+        return copied
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare field values only; the canonical cache is not state."""
+        if not isinstance(other, TurnRecord):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def __hash__(self) -> int:
+        """Hash field values, consistent with __eq__."""
+        return hash(tuple(self.__dict__.values()))
+
+    def _canonical_dict(self) -> dict[str, Any]:
+        """Get JSON-mode dict of this turn, computed once per change."""
+        # Go through __pydantic_private__ directly: private attribute access
+        # via BaseModel.__getattr__ costs more than the dump it saves
+        private = self.__pydantic_private__
+        cache = private["_canonical_cache"]
+        if cache is None:
+            # All fields are JSON primitives except created_at, so the field
+            # dict is used directly instead of pydantic's recursive model_dump
+            cache = dict(self.__dict__)
+            cache["created_at"] = _datetime_to_json(self.created_at)
+            private["_canonical_cache"] = cache
+        return cache
+
+    def _floats_match(self) -> bool:
+        """Check orjson_floats_match for this turn, computed once per change."""
+        private = self.__pydantic_private__
+        match = private["_floats_match_cache"]
+        if match is None:
+            match = orjson_floats_match(self._canonical_dict())
+            private["_floats_match_cache"] = match
+        return match
+
 
 class RuntimeState(BaseModel):
     """Runtime state for resume capability.
@@ -118,9 +175,12 @@ class ArtifactReference(BaseModel):
 
     Note: ZIP bundling is not implemented. Artifacts must exist
     at the resolved path for successful resume.
+
+    Frozen: identical references hash equal and can be deduplicated
+    with a set.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     # Turn association
     turn_index: int = Field(
@@ -188,6 +248,36 @@ class WorldStateDTO(BaseModel):
         description="Config snapshot at save time",
     )
 
+    def canonical_data(self) -> dict[str, Any]:
+        """Get JSON-mode dict for canonical serialization.
+
+        Equivalent to model_dump(mode="json"), but reuses each TurnRecord's
+        cached dump so saves only pay for turns added since the last save.
+        Turn dicts are shallow copies, so callers cannot alter the cache.
+
+        Returns:
+            JSON-compatible dict of this world state
+        """
+        data = self.model_dump(mode="json", exclude={"history"})
+        data["history"] = [dict(turn._canonical_dict()) for turn in self.history]
+        return data
+
+    def canonical_floats_match(self, data: dict[str, Any]) -> bool:
+        """Check that orjson formats every float of canonical_data() like the stdlib.
+
+        Turns use their cached check; only the small non-history sections
+        of data are walked.
+
+        Args:
+            data: Result of canonical_data()
+
+        Returns:
+            True if the orjson output equals the stdlib output
+        """
+        return all(turn._floats_match() for turn in self.history) and all(
+            orjson_floats_match(value) for key, value in data.items() if key != "history"
+        )
+
     @field_validator("history", mode="before")
     @classmethod
     def copy_history(cls, v):
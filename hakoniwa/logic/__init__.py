@@ -3,11 +3,22 @@
 Contains reusable business logic components.
 """
 
-from hakoniwa.logic.matcher import (
-    FuzzyMatcher,
-    suggest_match,
-    expand_queries,
-)
+from typing import TYPE_CHECKING, Any
+
+from hakoniwa.logic.matcher import suggest_match
+
+if TYPE_CHECKING:
+    from hakoniwa.logic.matcher import FuzzyMatcher, expand_queries
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported matcher names (see hakoniwa.logic.matcher)."""
+    if name in ("FuzzyMatcher", "expand_queries"):
+        from hakoniwa.logic import matcher
+
+        return getattr(matcher, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "FuzzyMatcher",
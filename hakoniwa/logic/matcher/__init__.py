@@ -29,6 +29,10 @@ Guardrails:
 - Generic nouns (床, 壁, etc.) are never auto-adopted
 """
 
+import importlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
 from hakoniwa.logic.matcher.types import (
     MatchMethod,
     AdoptionStatus,
@@ -37,19 +41,67 @@ from hakoniwa.logic.matcher.types import (
     AuditLogEntry,
     GENERIC_NOUNS,
 )
-from hakoniwa.logic.matcher.matcher import Matcher
-from hakoniwa.logic.matcher.fuzzy import FuzzyMatcher, is_rapidfuzz_available
-from hakoniwa.logic.matcher.preprocess import (
-    expand_queries,
-    extract_x_no_y_pattern,
-    normalize_query,
-    extract_action_object,
-)
-from hakoniwa.logic.matcher.audit_log import (
-    AuditLogger,
-    InMemoryAuditLogger,
-    load_audit_log,
-)
+
+if TYPE_CHECKING:
+    from hakoniwa.logic.matcher.matcher import Matcher, prepare_world_objects
+    from hakoniwa.logic.matcher.fuzzy import FuzzyMatcher, is_rapidfuzz_available
+    from hakoniwa.logic.matcher.preprocess import (
+        expand_queries,
+        extract_x_no_y_pattern,
+        normalize_query,
+        extract_action_object,
+    )
+    from hakoniwa.logic.matcher.audit_log import (
+        AuditLogger,
+        InMemoryAuditLogger,
+        load_audit_log,
+    )
+
+# Heavy submodules (rapidfuzz, regex tables, audit I/O) are imported on
+# first attribute access (PEP 562) instead of at package import.
+_LAZY_ATTRS: dict[str, str] = {
+    "Matcher": "hakoniwa.logic.matcher.matcher",
+    "prepare_world_objects": "hakoniwa.logic.matcher.matcher",
+    "FuzzyMatcher": "hakoniwa.logic.matcher.fuzzy",
+    "is_rapidfuzz_available": "hakoniwa.logic.matcher.fuzzy",
+    "expand_queries": "hakoniwa.logic.matcher.preprocess",
+    "extract_x_no_y_pattern": "hakoniwa.logic.matcher.preprocess",
+    "normalize_query": "hakoniwa.logic.matcher.preprocess",
+    "extract_action_object": "hakoniwa.logic.matcher.preprocess",
+    "AuditLogger": "hakoniwa.logic.matcher.audit_log",
+    "InMemoryAuditLogger": "hakoniwa.logic.matcher.audit_log",
+    "load_audit_log": "hakoniwa.logic.matcher.audit_log",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+@lru_cache(maxsize=8)
+def _get_suggest_matcher(threshold: float) -> "FuzzyMatcher":
+    """Get a shared suggestion-only FuzzyMatcher for a threshold.
+
+    FuzzyMatcher holds only its thresholds, so instances can be reused
+    across calls instead of being rebuilt per query.
+    """
+    from hakoniwa.logic.matcher.fuzzy import FuzzyMatcher
+
+    return FuzzyMatcher(
+        suggest_threshold=threshold,
+        allow_auto_adopt=False,  # CRITICAL: Never auto-adopt
+    )
 
 
 def suggest_match(
@@ -79,10 +131,13 @@ def suggest_match(
         >>> suggest_match("存在しない", {"テレビ", "ソファ"})
         None
     """
-    matcher = FuzzyMatcher(
-        suggest_threshold=threshold,
-        allow_auto_adopt=False,  # CRITICAL: Never auto-adopt
-    )
+    # Fast path: exact match takes priority, no expansion/matching needed
+    if query in world_objects:
+        return (query, 1.0)
+
+    from hakoniwa.logic.matcher.preprocess import expand_queries
+
+    matcher = _get_suggest_matcher(threshold)
 
     # Optionally expand queries
     queries_to_try = [query]
@@ -117,6 +172,7 @@ __all__ = [
     "GENERIC_NOUNS",
     # Matchers
     "Matcher",
+    "prepare_world_objects",
     "FuzzyMatcher",
     "is_rapidfuzz_available",
     # Preprocessor
@@ -5,6 +5,7 @@ Logs are written in JSONL format for easy analysis.
 """
 
 import json
+from collections.abc import Collection
 from pathlib import Path
 
 from hakoniwa.logic.matcher.types import AuditLogEntry, MatchResult
@@ -40,13 +41,14 @@ class AuditLogger:
             f.write("\n")
 
     def log_match_result(
-        self, result: MatchResult, world_objects: set[str]
+        self, result: MatchResult, world_objects: Collection[str]
     ) -> AuditLogEntry:
         """Log a match result.
 
         Args:
             result: The match result
-            world_objects: The world objects used
+            world_objects: The world objects used (a tuple is taken as
+                pre-sorted)
 
         Returns:
             The created audit log entry
@@ -75,13 +77,14 @@ class InMemoryAuditLogger:
         self.entries.append(entry)
 
     def log_match_result(
-        self, result: MatchResult, world_objects: set[str]
+        self, result: MatchResult, world_objects: Collection[str]
     ) -> AuditLogEntry:
         """Log a match result.
 
         Args:
             result: The match result
-            world_objects: The world objects used
+            world_objects: The world objects used (a tuple is taken as
+                pre-sorted)
 
         Returns:
             The created audit log entry
@@ -130,7 +133,8 @@ def load_audit_log(log_path: Path | str) -> list[AuditLogEntry]:
                 AuditLogEntry(
                     timestamp=datetime.fromisoformat(data["timestamp"]),
                     input_query=data["input_query"],
-                    world_objects=data["world_objects"],
+                    # Written sorted by to_dict()
+                    world_objects=tuple(data["world_objects"]),
                     candidates=data["candidates"],
                     adopted=data["adopted"],
                     status=data["status"],
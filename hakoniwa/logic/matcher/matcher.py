@@ -3,7 +3,10 @@
 Defines the abstract interface that all matcher implementations must follow.
 """
 
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from functools import lru_cache
 
 from hakoniwa.logic.matcher.types import (
     MatchCandidate,
@@ -14,6 +17,28 @@ from hakoniwa.logic.matcher.types import (
 )
 
 
+@lru_cache(maxsize=32)
+def _prepare_world(world_objects: frozenset[str]) -> frozenset[str]:
+    """Intern world object names (cached per distinct world)."""
+    return frozenset(map(sys.intern, world_objects))
+
+
+def prepare_world_objects(world_objects: Iterable[str]) -> frozenset[str]:
+    """Normalize world objects once for repeated matching.
+
+    Callers that match many queries against the same world should pass
+    the returned frozenset to Matcher.match; the interned names are
+    computed once and reused for every call on that world.
+
+    Args:
+        world_objects: Object names in the world
+
+    Returns:
+        Frozenset of interned object names
+    """
+    return _prepare_world(frozenset(world_objects))
+
+
 class Matcher(ABC):
     """Abstract base class for semantic matchers.
 
@@ -65,16 +90,23 @@ class Matcher(ABC):
         """
         pass
 
-    def match(self, query: str, world_objects: set[str]) -> MatchResult:
+    def match(
+        self, query: str, world_objects: set[str] | frozenset[str]
+    ) -> MatchResult:
         """Perform matching and determine adoption status.
 
         Args:
             query: The query string to match
             world_objects: Set of valid object names in the world
+                (frozensets, e.g. from prepare_world_objects, are
+                interned once and cached)
 
         Returns:
             MatchResult with candidates and adoption decision
         """
+        if isinstance(world_objects, frozenset):
+            world_objects = _prepare_world(world_objects)
+
         # Guard: Empty world means no match possible
         if not world_objects:
             return MatchResult(
@@ -3,9 +3,23 @@
 Defines DTOs for match candidates, results, and audit logging.
 """
 
+import sys
+from collections.abc import Collection
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+
+
+# Names up to this length are interned so GENERIC_NOUNS / world_objects
+# lookups can hit CPython's identity fast path
+_INTERN_MAX_LEN = 32
+
+
+@lru_cache(maxsize=32)
+def _sorted_world(world_objects: frozenset[str]) -> tuple[str, ...]:
+    """Sort a world's objects once; entries for the same world share it."""
+    return tuple(sorted(world_objects))
 
 
 class MatchMethod(Enum):
@@ -24,7 +38,7 @@ class AdoptionStatus(Enum):
     REJECTED = "rejected"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatchCandidate:
     """A candidate match for a query.
 
@@ -39,12 +53,14 @@ class MatchCandidate:
     method: MatchMethod = MatchMethod.FUZZY
 
     def __post_init__(self):
-        """Validate score range."""
+        """Validate score range and intern short names."""
         if not 0.0 <= self.score <= 1.0:
             raise ValueError(f"Score must be between 0.0 and 1.0, got {self.score}")
+        if len(self.name) <= _INTERN_MAX_LEN:
+            object.__setattr__(self, "name", sys.intern(self.name))
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of a matching operation.
 
@@ -63,7 +79,7 @@ class MatchResult:
     rejection_reason: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditLogEntry:
     """Audit log entry for a matching operation.
 
@@ -72,7 +88,8 @@ class AuditLogEntry:
     Attributes:
         timestamp: When the operation occurred
         input_query: The original query
-        world_objects: The set of objects in the world
+        world_objects: The objects in the world (a tuple is taken as
+            pre-sorted; other collections are sorted on to_dict)
         candidates: Match candidates with scores
         adopted: The adopted candidate name (if any)
         status: The adoption status
@@ -81,7 +98,7 @@ class AuditLogEntry:
 
     timestamp: datetime
     input_query: str
-    world_objects: list[str]
+    world_objects: Collection[str]
     candidates: list[dict]  # [{"name": str, "score": float, "method": str}]
     adopted: str | None
     status: str
@@ -89,13 +106,14 @@ class AuditLogEntry:
 
     @classmethod
     def from_match_result(
-        cls, result: MatchResult, world_objects: set[str]
+        cls, result: MatchResult, world_objects: Collection[str]
     ) -> "AuditLogEntry":
         """Create audit log entry from a match result.
 
         Args:
             result: The match result
-            world_objects: The world objects used for matching
+            world_objects: The world objects used for matching; pass a
+                pre-sorted tuple to skip sorting entirely
 
         Returns:
             AuditLogEntry instance
@@ -103,7 +121,12 @@ class AuditLogEntry:
         return cls(
             timestamp=datetime.now(),
             input_query=result.query,
-            world_objects=sorted(world_objects),
+            # Snapshot only; sorting is deferred to to_dict() (log flush)
+            world_objects=(
+                world_objects
+                if isinstance(world_objects, tuple)
+                else frozenset(world_objects)
+            ),
             candidates=[
                 {
                     "name": c.name,
@@ -119,10 +142,17 @@ class AuditLogEntry:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
+        world_objects = self.world_objects
+        if isinstance(world_objects, frozenset):
+            # Sorted once per world, not once per entry
+            world_objects = _sorted_world(world_objects)
+        elif not isinstance(world_objects, tuple):
+            world_objects = sorted(world_objects)
+
         return {
             "timestamp": self.timestamp.isoformat(),
             "input_query": self.input_query,
-            "world_objects": self.world_objects,
+            "world_objects": list(world_objects),
             "candidates": self.candidates,
             "adopted": self.adopted,
             "status": self.status,
@@ -132,18 +162,21 @@ class AuditLogEntry:
 
 # Generic nouns that should not be auto-adopted
 GENERIC_NOUNS: frozenset[str] = frozenset(
-    {
-        "床",
-        "壁",
-        "天井",
-        "空気",
-        "部屋",
-        "場所",
-        "floor",
-        "wall",
-        "ceiling",
-        "air",
-        "room",
-        "place",
-    }
+    map(
+        sys.intern,
+        (
+            "床",
+            "壁",
+            "天井",
+            "空気",
+            "部屋",
+            "場所",
+            "floor",
+            "wall",
+            "ceiling",
+            "air",
+            "room",
+            "place",
+        ),
+    )
 )
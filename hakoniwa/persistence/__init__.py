@@ -1,10 +1,18 @@
 """Persistence module for HAKONIWA world state."""
 
-from hakoniwa.persistence.load import load_dry_run, load_world_state
+from hakoniwa.persistence.load import (
+    load_dry_run,
+    load_world_state,
+    try_load_world_state,
+)
 from hakoniwa.persistence.save import save_world_state
+from hakoniwa.persistence.snapshot import restore_world_state, snapshot_world_state
 
 __all__ = [
     "load_dry_run",
     "load_world_state",
+    "restore_world_state",
     "save_world_state",
+    "snapshot_world_state",
+    "try_load_world_state",
 ]
@@ -5,58 +5,71 @@ Load: Hydrate WorldStateDTO from file
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from hakoniwa.dto.manifest import CURRENT_SCHEMA_VERSION
 from hakoniwa.dto.world_state import WorldStateDTO
-from hakoniwa.serializer.canonical import compute_hash, deserialize_from_json
+from hakoniwa.serializer.canonical import HASH_ALGORITHMS, compute_hash, parse_json
 
 
-def load_dry_run(path: Path) -> tuple[bool, list[str]]:
-    """Validate world state file without loading.
+def _verify_world_state(path: Path) -> tuple[WorldStateDTO | None, list[str]]:
+    """Run all load checks and return the validated DTO.
 
     Checks:
     1. File exists
-    2. Hash file exists and matches
+    2. A hash file (.sha256 or .blake2b) exists and matches
     3. JSON is valid
     4. Schema version is compatible
+    5. Structure validates as WorldStateDTO
 
     Args:
         path: Path to state file
 
     Returns:
-        Tuple of (is_valid, list of error messages)
+        Tuple of (validated WorldStateDTO or None, list of error messages)
     """
     errors: list[str] = []
 
     # Check file exists
     if not path.exists():
-        return False, [f"File not found: {path}"]
-
-    # Check hash file exists
-    hash_path = Path(str(path) + ".sha256")
-    if not hash_path.exists():
-        return False, [f"Hash file not found: {hash_path}"]
-
-    # Read content
+        return None, [f"File not found: {path}"]
+
+    # Check hash files exist (algorithm is picked from the sidecar suffix)
+    hash_paths = {
+        algorithm: Path(f"{path}.{algorithm}")
+        for algorithm in HASH_ALGORITHMS
+        if Path(f"{path}.{algorithm}").exists()
+    }
+    if not hash_paths:
+        suffixes = " or ".join(f"{path}.{algorithm}" for algorithm in HASH_ALGORITHMS)
+        return None, [f"Hash file not found: {suffixes}"]
+
+    # Read content (raw bytes: hashed and parsed without a str decode)
     try:
-        content = path.read_text(encoding="utf-8")
+        content = path.read_bytes()
     except Exception as e:
-        return False, [f"Failed to read file: {e}"]
-
-    # Verify hash
-    expected_hash = hash_path.read_text(encoding="utf-8").strip()
-    actual_hash = compute_hash(content)
-
-    if actual_hash != expected_hash:
-        errors.append(f"Hash mismatch: expected {expected_hash[:16]}..., got {actual_hash[:16]}...")
-        return False, errors
+        return None, [f"Failed to read file: {e}"]
+
+    # Verify hash: content is intact if any existing sidecar matches, so a
+    # stale sidecar left by another algorithm cannot mask a valid one
+    mismatches = []
+    for algorithm, hash_path in hash_paths.items():
+        expected_hash = hash_path.read_text(encoding="utf-8").strip()
+        actual_hash = compute_hash(content, algorithm)
+        if actual_hash == expected_hash:
+            break
+        mismatches.append(
+            f"Hash mismatch: expected {expected_hash[:16]}..., got {actual_hash[:16]}..."
+        )
+    else:
+        return None, mismatches[:1]
 
     # Validate JSON
     try:
-        data = json.loads(content)
+        data = parse_json(content)
     except json.JSONDecodeError as e:
-        return False, [f"Invalid JSON: {e}"]
+        return None, [f"Invalid JSON: {e}"]
 
     # Check schema version
     manifest = data.get("manifest", {})
@@ -67,15 +80,45 @@ def load_dry_run(path: Path) -> tuple[bool, list[str]]:
             f"Schema version mismatch: file has {schema_version}, "
             f"current is {CURRENT_SCHEMA_VERSION}"
         )
-        return False, errors
+        return None, errors
 
-    # Try to parse as DTO (validates structure)
+    # Validate the already-parsed data as DTO (validates structure)
     try:
-        deserialize_from_json(content, WorldStateDTO)
+        return WorldStateDTO.model_validate(data), []
     except Exception as e:
-        return False, [f"Invalid world state structure: {e}"]
+        return None, [f"Invalid world state structure: {e}"]
+
+
+def load_dry_run(path: Path) -> tuple[bool, list[str]]:
+    """Validate world state file without loading.
+
+    Runs the same checks as a full load (hash, JSON, schema version,
+    structure) and discards the result.
+
+    Args:
+        path: Path to state file
+
+    Returns:
+        Tuple of (is_valid, list of error messages)
+    """
+    state, errors = _verify_world_state(path)
+    return state is not None, errors
+
+
+@lru_cache(maxsize=16)
+def _major_version(version: str) -> int | None:
+    """Parse the major component of a version string (cached).
+
+    Args:
+        version: Version string such as "1.0.0"
 
-    return True, []
+    Returns:
+        Major version, or None if it is not an integer
+    """
+    try:
+        return int(version.partition(".")[0])
+    except ValueError:
+        return None
 
 
 def _is_compatible_version(file_version: str, current_version: str) -> bool:
@@ -90,12 +133,26 @@ def _is_compatible_version(file_version: str, current_version: str) -> bool:
     Returns:
         True if compatible
     """
-    try:
-        file_major = int(file_version.split(".")[0])
-        current_major = int(current_version.split(".")[0])
-        return file_major == current_major
-    except (ValueError, IndexError):
+    if not isinstance(file_version, str):
         return False
+    file_major = _major_version(file_version)
+    return file_major is not None and file_major == _major_version(current_version)
+
+
+def try_load_world_state(path: Path) -> tuple[WorldStateDTO | None, list[str]]:
+    """Validate and load world state in one call.
+
+    Use this instead of load_dry_run() followed by load_world_state()
+    when both the state and the validation errors are needed.
+
+    Args:
+        path: Path to state file
+
+    Returns:
+        Tuple of (loaded WorldStateDTO or None, list of error messages)
+    """
+    # Validation already builds the DTO; no second read or parse
+    return _verify_world_state(path)
 
 
 def load_world_state(path: Path) -> WorldStateDTO:
@@ -111,11 +168,7 @@ def load_world_state(path: Path) -> WorldStateDTO:
         ValueError: If file is invalid
         FileNotFoundError: If file doesn't exist
     """
-    # First validate
-    is_valid, errors = load_dry_run(path)
-    if not is_valid:
+    state, errors = try_load_world_state(path)
+    if state is None:
         raise ValueError(f"Invalid world state file: {'; '.join(errors)}")
-
-    # Load and deserialize
-    content = path.read_text(encoding="utf-8")
-    return deserialize_from_json(content, WorldStateDTO)
+    return state
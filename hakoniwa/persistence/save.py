@@ -3,40 +3,68 @@
 Saves WorldStateDTO to canonical JSON with hash file.
 """
 
+import os
 from pathlib import Path
 
 from hakoniwa.dto.world_state import WorldStateDTO
-from hakoniwa.serializer.canonical import serialize_to_json, compute_hash
+from hakoniwa.serializer.canonical import HASH_ALGORITHMS, serialize_to_bytes, compute_hash
 
 
-def save_world_state(dto: WorldStateDTO, path: Path) -> str:
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data via a temp file and os.replace (no torn files on crash)."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _is_unchanged(path: Path, hash_path: Path, content_hash: str, size: int) -> bool:
+    """Check whether the existing save already holds this content."""
+    try:
+        return (
+            hash_path.read_text(encoding="utf-8").strip() == content_hash
+            and path.stat().st_size == size
+        )
+    except FileNotFoundError:
+        return False
+
+
+def save_world_state(dto: WorldStateDTO, path: Path, algorithm: str = "sha256") -> str:
     """Save world state to file.
 
-    Creates:
+    Creates (each file is replaced atomically; nothing is rewritten when
+    the existing save already has the same content hash):
     - path: Canonical JSON file with world state
-    - path.sha256: Hash file for integrity verification
+    - path.<algo>: Hash file for integrity verification, where <algo> is
+      the algorithm argument (sha256 by default, or blake2b)
 
     Args:
         dto: WorldStateDTO to save
         path: Path to save file
+        algorithm: Integrity hash algorithm, "sha256" or "blake2b"
 
     Returns:
-        SHA256 hash of saved content
+        Hash of saved content
     """
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Serialize to canonical JSON
-    content = serialize_to_json(dto)
+    # Serialize straight to canonical JSON bytes; the same bytes are
+    # hashed and written
+    data = serialize_to_bytes(dto)
 
     # Compute hash
-    content_hash = compute_hash(content)
+    content_hash = compute_hash(data, algorithm)
 
-    # Write state file
-    path.write_text(content, encoding="utf-8")
+    # Write state file, then hash file (each replaced atomically), unless
+    # the existing save has identical content
+    hash_path = Path(f"{path}.{algorithm}")
+    if not _is_unchanged(path, hash_path, content_hash, len(data)):
+        _atomic_write_bytes(path, data)
+        _atomic_write_bytes(hash_path, content_hash.encode("utf-8"))
 
-    # Write hash file
-    hash_path = Path(str(path) + ".sha256")
-    hash_path.write_text(content_hash, encoding="utf-8")
+    # Remove stale sidecars from a previous save with another algorithm
+    for other in HASH_ALGORITHMS:
+        if other != algorithm:
+            Path(f"{path}.{other}").unlink(missing_ok=True)
 
     return content_hash
@@ -0,0 +1,43 @@
+"""In-process snapshots of HAKONIWA world state.
+
+Snapshots are checkpoints for resume/rollback within a single process.
+They are pickled and carry no hash or schema version; use
+save_world_state() for anything written to disk.
+"""
+
+import pickle
+
+from hakoniwa.dto.world_state import WorldStateDTO
+
+
+def snapshot_world_state(dto: WorldStateDTO) -> bytes:
+    """Capture world state as an opaque in-memory snapshot.
+
+    Args:
+        dto: WorldStateDTO to snapshot
+
+    Returns:
+        Snapshot bytes (pickle protocol 5)
+    """
+    return pickle.dumps(dto, protocol=5)
+
+
+def restore_world_state(snapshot: bytes) -> WorldStateDTO:
+    """Restore world state from a snapshot_world_state() result.
+
+    Only pass snapshots created by this process: unpickling untrusted
+    data can execute arbitrary code.
+
+    Args:
+        snapshot: Bytes returned by snapshot_world_state()
+
+    Returns:
+        Restored WorldStateDTO (independent of the original)
+
+    Raises:
+        TypeError: If the snapshot does not contain a WorldStateDTO
+    """
+    dto = pickle.loads(snapshot)
+    if not isinstance(dto, WorldStateDTO):
+        raise TypeError(f"Snapshot does not contain a WorldStateDTO: {type(dto).__name__}")
+    return dto
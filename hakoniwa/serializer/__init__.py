@@ -1,13 +1,19 @@
 """Serializer module for HAKONIWA."""
 
 from hakoniwa.serializer.canonical import (
+    HASH_ALGORITHMS,
     compute_hash,
     deserialize_from_json,
+    parse_json,
+    serialize_to_bytes,
     serialize_to_json,
 )
 
 __all__ = [
+    "HASH_ALGORITHMS",
     "compute_hash",
     "deserialize_from_json",
+    "parse_json",
+    "serialize_to_bytes",
     "serialize_to_json",
 ]
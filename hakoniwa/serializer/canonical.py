@@ -13,9 +13,20 @@ from typing import Any, Type, TypeVar
 
 from pydantic import BaseModel
 
+# Try to import orjson for faster canonical encoding, fall back to stdlib json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 T = TypeVar("T", bound=BaseModel)
 
+# Supported integrity hash algorithms, in sidecar lookup order
+HASH_ALGORITHMS = ("sha256", "blake2b")
+
 
 def _datetime_handler(obj: Any) -> str:
     """JSON serializer for datetime objects."""
@@ -24,6 +35,65 @@ def _datetime_handler(obj: Any) -> str:
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+def _canonical_data(obj: BaseModel) -> dict[str, Any]:
+    """Convert model to a JSON-compatible dict.
+
+    Models may provide canonical_data() to reuse cached parts
+    (e.g. WorldStateDTO history).
+    """
+    canonical_data = getattr(obj, "canonical_data", None)
+    return canonical_data() if canonical_data else obj.model_dump(mode="json")
+
+
+def _stdlib_dumps(data: dict[str, Any]) -> str:
+    """Encode canonical JSON with the stdlib encoder."""
+    # Serialize with canonical settings
+    content = json.dumps(
+        data,
+        ensure_ascii=False,
+        indent=2,
+        sort_keys=True,
+        default=_datetime_handler,
+    )
+
+    # Ensure trailing newline
+    if not content.endswith("\n"):
+        content += "\n"
+
+    return content
+
+
+def orjson_floats_match(value: Any) -> bool:
+    """Check that orjson formats every float in value like the stdlib.
+
+    orjson writes e.g. 1e-05 as 0.00001 and 1e-07 as 1e-7, while the stdlib
+    uses float.__repr__; data with such floats is encoded with the stdlib so
+    the canonical bytes do not depend on whether orjson is installed.
+    Always True without orjson.
+    """
+    if not ORJSON_AVAILABLE:
+        return True
+    if isinstance(value, float):
+        return orjson.dumps(value) == repr(value).encode("ascii")
+    if isinstance(value, dict):
+        return all(orjson_floats_match(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return all(orjson_floats_match(item) for item in value)
+    return True
+
+
+def _floats_match(obj: BaseModel, data: dict[str, Any]) -> bool:
+    """Check the floats of obj's canonical data (see orjson_floats_match).
+
+    Models may provide canonical_floats_match(data) to reuse cached checks
+    (e.g. WorldStateDTO history) instead of walking the whole tree.
+    """
+    canonical_floats_match = getattr(obj, "canonical_floats_match", None)
+    if canonical_floats_match:
+        return canonical_floats_match(data)
+    return orjson_floats_match(data)
+
+
 def serialize_to_json(obj: BaseModel) -> str:
     """Serialize Pydantic model to canonical JSON.
 
@@ -40,46 +110,84 @@ def serialize_to_json(obj: BaseModel) -> str:
     Returns:
         Canonical JSON string
     """
-    # Convert to dict, handling datetime
-    data = obj.model_dump(mode="json")
+    return serialize_to_bytes(obj).decode("utf-8")
 
-    # Serialize with canonical settings
-    content = json.dumps(
-        data,
-        ensure_ascii=False,
-        indent=2,
-        sort_keys=True,
-        default=_datetime_handler,
-    )
 
-    # Ensure trailing newline
-    if not content.endswith("\n"):
-        content += "\n"
+def serialize_to_bytes(obj: BaseModel) -> bytes:
+    """Serialize Pydantic model to canonical JSON as UTF-8 bytes.
 
-    return content
+    Same output as serialize_to_json(obj).encode("utf-8"); with orjson the
+    bytes are produced directly, without an intermediate str. The output
+    is identical with and without orjson.
 
+    Args:
+        obj: Pydantic model to serialize
 
-def deserialize_from_json(content: str, model_class: Type[T]) -> T:
+    Returns:
+        Canonical JSON bytes
+    """
+    data = _canonical_data(obj)
+
+    if ORJSON_AVAILABLE and _floats_match(obj, data):
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+        )
+
+    return _stdlib_dumps(data).encode("utf-8")
+
+
+def parse_json(content: str | bytes) -> Any:
+    """Parse JSON text or UTF-8 bytes, using orjson when available.
+
+    Args:
+        content: JSON string or bytes
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If content is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def deserialize_from_json(content: str | bytes, model_class: Type[T]) -> T:
     """Deserialize JSON to Pydantic model.
 
     Args:
-        content: JSON string
+        content: JSON string or bytes
         model_class: Pydantic model class to deserialize to
 
     Returns:
         Deserialized model instance
     """
-    data = json.loads(content)
-    return model_class(**data)
+    data = parse_json(content)
+    return model_class.model_validate(data)
+
 
+def compute_hash(content: str | bytes, algorithm: str = "sha256") -> str:
+    """Compute integrity hash of content.
 
-def compute_hash(content: str) -> str:
-    """Compute SHA256 hash of content.
+    The hash is an integrity checksum, not a security primitive, so it is
+    computed with usedforsecurity=False.
 
     Args:
-        content: String content to hash
+        content: String content (hashed as UTF-8) or raw bytes to hash
+        algorithm: "sha256" (default) or "blake2b" (32-byte digest)
 
     Returns:
-        Hex-encoded SHA256 hash
+        Hex-encoded hash
+
+    Raises:
+        ValueError: If algorithm is not supported
     """
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    if algorithm == "sha256":
+        return hashlib.sha256(content, usedforsecurity=False).hexdigest()
+    if algorithm == "blake2b":
+        return hashlib.blake2b(content, digest_size=32, usedforsecurity=False).hexdigest()
+    raise ValueError(f"Unsupported hash algorithm: {algorithm}")
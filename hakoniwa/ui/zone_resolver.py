@@ -29,6 +29,11 @@ _NAME_RULES: list[tuple[list[str], int]] = [
     (["shelf", "bookshelf", "bookcase"], 1),  # North
 ]
 
+# _NAME_RULES flattened once to (keyword, zone) pairs, in priority order
+_NAME_ZONE_KEYWORDS: tuple[tuple[str, int], ...] = tuple(
+    (kw, zone_idx) for keywords, zone_idx in _NAME_RULES for kw in keywords
+)
+
 # Type → emoji
 _TYPE_ICONS: dict[str, str] = {
     "character": "👤",
@@ -73,10 +78,9 @@ def resolve_zone(obj: Mapping[str, object]) -> int:
     name = obj.get("name")
     if isinstance(name, str):
         name_lower = name.lower()
-        for keywords, zone_idx in _NAME_RULES:
-            for kw in keywords:
-                if kw in name_lower:
-                    return zone_idx
+        for kw, zone_idx in _NAME_ZONE_KEYWORDS:
+            if kw in name_lower:
+                return zone_idx
 
     # 3. Default
     return 4
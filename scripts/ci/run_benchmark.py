@@ -16,6 +16,7 @@ Options:
     --scenarios [all|casual|topic|emotional]  Which scenarios to run
     --json                                    Output as JSON
     --verbose                                 Show detailed output
+    --workers N                               Scenarios run at once (default: all)
 
 Exit codes:
     0: All metrics within targets
@@ -25,20 +26,52 @@ Exit codes:
 
 import argparse
 import json
+import queue
 import re
 import sys
+import threading
 import time
-from dataclasses import dataclass, field, asdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Try to import orjson for faster JSON output, fall back to stdlib json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add project paths
+# duo_talk_core / duo_talk_director come from the editable installs in the
+# README setup (pip install -e ../duo-talk-core ../duo-talk-director); only
+# src/ (evaluation package, not part of this project's install) is added here
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
-sys.path.insert(0, str(PROJECT_ROOT.parent / "duo-talk-core" / "src"))
-sys.path.insert(0, str(PROJECT_ROOT.parent / "duo-talk-director" / "src"))
+
+# duo-talk packages are imported once here; a missing package is reported
+# by main() (exit code 2) instead of failing inside a scenario
+try:
+    from duo_talk_core import create_dialogue_manager, GenerationMode
+    from duo_talk_core.dialogue_manager import DialogueSession
+    from duo_talk_director import DirectorMinimal
+    from duo_talk_director.checks.action_sanitizer import ActionSanitizer
+    from duo_talk_director.logging import (
+        SanitizerLogger,
+        ThoughtLogger,
+        LogStore,
+        reset_log_store,
+    )
+
+    DUO_TALK_IMPORT_ERROR: Optional[ImportError] = None
+except ImportError as e:
+    DUO_TALK_IMPORT_ERROR = e
 
 
 # Benchmark scenarios per PHASE2_3_SPEC.md
@@ -104,7 +137,7 @@ class BenchmarkMetrics:
     total_retries: int = 0
     action_present_count: int = 0
     action_sanitized_count: int = 0
-    blocked_props_freq: dict = field(default_factory=dict)
+    blocked_props_freq: Counter = field(default_factory=Counter)
 
     @property
     def format_success_rate(self) -> float:
@@ -132,11 +165,7 @@ class BenchmarkMetrics:
 
     @property
     def blocked_props_top5(self) -> list[tuple[str, int]]:
-        sorted_props = sorted(
-            self.blocked_props_freq.items(),
-            key=lambda x: -x[1]
-        )
-        return sorted_props[:5]
+        return self.blocked_props_freq.most_common(5)
 
 
 @dataclass
@@ -154,7 +183,19 @@ class BenchmarkResult:
         result = {
             "timestamp": self.timestamp,
             "scenarios_run": self.scenarios_run,
-            "results": [asdict(r) for r in self.results],
+            # TurnResult holds only JSON-safe values, so its __dict__ is used
+            # as is instead of asdict()'s recursive deep copy
+            "results": [
+                {
+                    "scenario": r.scenario,
+                    "prompt": r.prompt,
+                    "turns": [vars(t) for t in r.turns],
+                    "success": r.success,
+                    "error": r.error,
+                    "execution_time": r.execution_time,
+                }
+                for r in self.results
+            ],
             "metrics": {
                 "total_turns": self.metrics.total_turns,
                 "format_success_rate": self.metrics.format_success_rate,
@@ -171,17 +212,14 @@ class BenchmarkResult:
         return result
 
 
-# Format validation patterns
-FORMAT_PATTERNS = [
-    re.compile(r"^（[^）]+）「[^」]+」$"),  # (action)「dialogue」
-    re.compile(r"^「[^」]+」$"),            # 「dialogue」 only
-    re.compile(r"^（[^）]+）「[^」]+」"),   # (action)「dialogue」 with continuation
-    re.compile(r"^「[^」]+」"),             # 「dialogue」 with continuation
-]
+# Dialogue marker pair with non-empty content
+_DIALOGUE_RE = re.compile(r"「[^」]+」")
 
 DEFAULT_THOUGHTS = ["(特に懸念はない)", "(No specific thought)", ""]
+_DEFAULT_THOUGHTS_SET = frozenset(DEFAULT_THOUGHTS)
 
 
+@lru_cache(maxsize=2048)
 def is_format_valid(output: str) -> bool:
     """Check if output matches valid format
 
@@ -189,42 +227,112 @@ def is_format_valid(output: str) -> bool:
     - （action）「dialogue」 - Japanese parentheses (preferred)
     - *action* 「dialogue」 - Asterisk format (acceptable)
     - 「dialogue」 - Dialogue only (acceptable)
-    """
-    if not output or not output.strip():
-        return False
 
-    output = output.strip()
-
-    # Must contain dialogue markers
-    if "「" not in output or "」" not in output:
-        return False
-
-    # Accept both action formats:
-    # - （action）「dialogue」
-    # - *action* 「dialogue」
-    # - 「dialogue」 only
-    # Just verify dialogue markers are present
-    return True
+    All of them are accepted as long as a non-empty 「dialogue」 is present.
+    """
+    return bool(output) and _DIALOGUE_RE.search(output) is not None
 
 
+@lru_cache(maxsize=2048)
 def is_thought_missing(thought: str) -> bool:
-    """Check if thought is missing or default"""
-    if not thought or not thought.strip():
+    """Check if thought is missing or default
+
+    Cached: thoughts are often empty or one of DEFAULT_THOUGHTS.
+    """
+    if not thought:
         return True
-    return thought.strip() in DEFAULT_THOUGHTS
+    # "" is in the set, so whitespace-only thoughts count as missing
+    return thought.strip() in _DEFAULT_THOUGHTS_SET
 
 
 def has_action(output: str) -> bool:
     """Check if output has action marker"""
-    if not output:
-        return False
-    return output.strip().startswith("（")
+    # Only the leading side matters, so lstrip instead of a full strip
+    return bool(output) and output.lstrip().startswith("（")
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text for verbose output"""
+    return f"{text[:limit]}..." if len(text) > limit else text
+
+
+# Keeps verbose output of concurrent scenarios from interleaving mid-line
+_PRINT_LOCK = threading.Lock()
+
+
+def _print_verbose(scenario_name: str, text: str) -> None:
+    """Print verbose output, each line prefixed with the scenario name"""
+    prefix = f"[{scenario_name}] "
+    with _PRINT_LOCK:
+        for line in text.splitlines():
+            print(prefix + line if line else "")
+
+
+_SANITIZER = None
+_SANITIZER_LOCK = threading.Lock()
+
+
+def _get_sanitizer():
+    """Get the shared ActionSanitizer, creating it on first use
+
+    sanitize() takes the scene per call and returns a fresh result, so one
+    instance is shared across scenarios (and scenario threads).
+    """
+    global _SANITIZER
+    with _SANITIZER_LOCK:
+        if _SANITIZER is None:
+            _SANITIZER = ActionSanitizer()
+    return _SANITIZER
+
+
+class _BackgroundLogWriter:
+    """Runs log calls on a daemon thread so turns don't wait on disk I/O"""
+
+    _STOP = object()
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, **kwargs) -> None:
+        """Queue a log call"""
+        self._queue.put((fn, kwargs))
+
+    def close(self) -> None:
+        """Write all queued records and stop the thread"""
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            fn, kwargs = item
+            try:
+                fn(**kwargs)
+            except Exception as e:
+                # Logging is best effort; never lose the benchmark over it
+                print(f"Warning: log write failed: {e}", file=sys.stderr)
+
+
+class _QueuedLogger:
+    """Logger proxy that hands log() calls to a _BackgroundLogWriter"""
+
+    def __init__(self, logger, writer: _BackgroundLogWriter):
+        self._logger = logger
+        self._writer = writer
+
+    def log(self, **kwargs) -> None:
+        self._writer.submit(self._logger.log, **kwargs)
 
 
 def run_scenario(
     scenario_name: str,
     config: dict,
     verbose: bool = False,
+    log_writer: Optional[_BackgroundLogWriter] = None,
 ) -> ScenarioResult:
     """Run a single benchmark scenario
 
@@ -232,47 +340,42 @@ def run_scenario(
         scenario_name: Name of scenario
         config: Scenario configuration
         verbose: Print detailed output
+        log_writer: Background writer for thought/sanitizer logs
+            (logs are written inline if None)
 
     Returns:
         ScenarioResult with all turn data
     """
-    from duo_talk_core import create_dialogue_manager, GenerationMode
-    from duo_talk_director import DirectorMinimal
-    from duo_talk_director.logging import (
-        SanitizerLogger,
-        ThoughtLogger,
-        LogStore,
-        reset_log_store,
-    )
-    from duo_talk_director.checks.action_sanitizer import ActionSanitizer
-
     if verbose:
-        print(f"\n{'='*60}")
-        print(f"Scenario: {scenario_name}")
-        print(f"Prompt: {config['prompt']}")
-        print(f"Turns: {config['turns']}")
-        print(f"{'='*60}")
+        _print_verbose(
+            scenario_name,
+            f"\n{'='*60}\n"
+            f"Scenario: {scenario_name}\n"
+            f"Prompt: {config['prompt']}\n"
+            f"Turns: {config['turns']}\n"
+            f"{'='*60}",
+        )
 
-    # Reset logging for this scenario
-    reset_log_store()
+    # Per-scenario log store (the global store is reset once by run_benchmark)
     log_store = LogStore(PROJECT_ROOT / "logs" / "benchmark")
     log_store.set_session_id(f"benchmark_{scenario_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
 
     thought_logger = ThoughtLogger(log_store)
     sanitizer_logger = SanitizerLogger(log_store)
-    sanitizer = ActionSanitizer()
+    if log_writer is not None:
+        thought_logger = _QueuedLogger(thought_logger, log_writer)
+        sanitizer_logger = _QueuedLogger(sanitizer_logger, log_writer)
+    sanitizer = _get_sanitizer()
 
     result = ScenarioResult(
         scenario=scenario_name,
         prompt=config["prompt"],
     )
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         # Create dialogue manager with DirectorMinimal
-        from duo_talk_core.dialogue_manager import DialogueSession
-
         manager = create_dialogue_manager(
             backend="ollama",
             model="gemma3:12b",
@@ -286,100 +389,148 @@ def run_scenario(
         session = DialogueSession(topic=config["prompt"], max_turns=config["turns"])
         speakers = ["やな", "あゆ"]
 
-        for turn_idx in range(config["turns"]):
-            speaker = speakers[turn_idx % 2]
-
-            # Generate turn using the correct API
-            turn = manager.generate_turn(
-                speaker_name=speaker,
+        def submit_turn(turn_idx: int):
+            """Start generating a turn from the current history."""
+            return generator.submit(
+                manager.generate_turn,
+                speaker_name=speakers[turn_idx % 2],
                 topic=config["prompt"],
                 history=session.get_history(),
                 turn_number=turn_idx,
             )
-            session.add_turn(turn)
 
-            # Extract thought and output from turn
-            thought = turn.thought or ""
-            output = turn.output or turn.content
+        # Single-worker pipeline: the LLM call for turn N+1 runs while
+        # turn N is sanitized, logged and recorded
+        with ThreadPoolExecutor(max_workers=1) as generator:
+            pending = submit_turn(0) if config["turns"] > 0 else None
+            for turn_idx in range(config["turns"]):
+                speaker = speakers[turn_idx % 2]
 
-            # Check for ActionSanitizer
-            sanitizer_result = sanitizer.sanitize(output, [])  # Empty scene for benchmark
-            action_sanitized = sanitizer_result.action_removed or sanitizer_result.action_replaced
-            blocked_props = sanitizer_result.blocked_props
+                turn = pending.result()
+                session.add_turn(turn)
 
-            # Log thought
-            thought_logger.log(
-                turn_number=turn_idx,
-                speaker=speaker,
-                thought=thought,
-            )
+                # Next turn only depends on history, which is now complete
+                if turn_idx + 1 < config["turns"]:
+                    pending = submit_turn(turn_idx + 1)
 
-            # Log sanitization if action was modified
-            if action_sanitized or sanitizer_result.original_action:
-                sanitizer_logger.log(
-                    turn_number=turn_idx,
-                    speaker=speaker,
-                    result=sanitizer_result,
+                _record_turn(
+                    result, turn, turn_idx, speaker,
+                    sanitizer, thought_logger, sanitizer_logger, verbose,
                 )
 
-            # Record turn result
-            turn_result = TurnResult(
-                turn_number=turn_idx,
-                speaker=speaker,
-                thought=thought,
-                output=output,
-                thought_missing=is_thought_missing(thought),
-                format_valid=is_format_valid(output),
-                retry_count=turn.retry_count,
-                action_present=has_action(output),
-                action_sanitized=action_sanitized,
-                blocked_props=blocked_props,
-            )
-            result.turns.append(turn_result)
-
-            if verbose:
-                status = "✅" if turn_result.format_valid else "❌"
-                thought_status = "⚠️ missing" if turn_result.thought_missing else ""
-                print(f"\nTurn {turn_idx + 1} ({speaker}) {status} {thought_status}")
-                print(f"  Thought: {thought[:50]}..." if len(thought) > 50 else f"  Thought: {thought}")
-                print(f"  Output: {output[:80]}..." if len(output) > 80 else f"  Output: {output}")
-
     except Exception as e:
         result.success = False
         result.error = str(e)
         if verbose:
-            print(f"Error: {e}")
+            _print_verbose(scenario_name, f"Error: {e}")
 
-    result.execution_time = time.time() - start_time
+    result.execution_time = time.perf_counter() - start_time
     return result
 
 
-def calculate_metrics(results: list[ScenarioResult]) -> BenchmarkMetrics:
-    """Calculate aggregated metrics from scenario results"""
-    metrics = BenchmarkMetrics()
-
-    for result in results:
-        for turn in result.turns:
-            metrics.total_turns += 1
+def _record_turn(
+    result: ScenarioResult,
+    turn,
+    turn_idx: int,
+    speaker: str,
+    sanitizer,
+    thought_logger,
+    sanitizer_logger,
+    verbose: bool = False,
+) -> None:
+    """Sanitize, log and record a generated turn
 
-            if turn.format_valid:
-                metrics.format_success_count += 1
+    Args:
+        result: ScenarioResult to append the turn to
+        turn: Generated turn from the dialogue manager
+        turn_idx: Zero-based turn index
+        speaker: Speaker name
+        sanitizer: ActionSanitizer instance
+        thought_logger: ThoughtLogger instance
+        sanitizer_logger: SanitizerLogger instance
+        verbose: Print detailed output
+    """
+    # Extract thought and output from turn
+    thought = turn.thought or ""
+    output = turn.output or turn.content
+
+    # Check for ActionSanitizer
+    sanitizer_result = sanitizer.sanitize(output, [])  # Empty scene for benchmark
+    action_sanitized = sanitizer_result.action_removed or sanitizer_result.action_replaced
+    blocked_props = sanitizer_result.blocked_props
+
+    # Log thought
+    thought_logger.log(
+        turn_number=turn_idx,
+        speaker=speaker,
+        thought=thought,
+    )
 
-            if turn.thought_missing:
-                metrics.thought_missing_count += 1
+    # Log sanitization if action was modified
+    if action_sanitized or sanitizer_result.original_action:
+        sanitizer_logger.log(
+            turn_number=turn_idx,
+            speaker=speaker,
+            result=sanitizer_result,
+        )
 
-            metrics.total_retries += turn.retry_count
+    # Record turn result
+    turn_result = TurnResult(
+        turn_number=turn_idx,
+        speaker=speaker,
+        thought=thought,
+        output=output,
+        thought_missing=is_thought_missing(thought),
+        format_valid=is_format_valid(output),
+        retry_count=turn.retry_count,
+        action_present=has_action(output),
+        action_sanitized=action_sanitized,
+        blocked_props=blocked_props,
+    )
+    result.turns.append(turn_result)
 
-            if turn.action_present:
-                metrics.action_present_count += 1
+    if verbose:
+        status = "✅" if turn_result.format_valid else "❌"
+        thought_status = "⚠️ missing" if turn_result.thought_missing else ""
+        _print_verbose(
+            result.scenario,
+            f"\nTurn {turn_idx + 1} ({speaker}) {status} {thought_status}\n"
+            f"  Thought: {_truncate(thought, 50)}\n"
+            f"  Output: {_truncate(output, 80)}",
+        )
 
-            if turn.action_sanitized:
-                metrics.action_sanitized_count += 1
 
-            for prop in turn.blocked_props:
-                metrics.blocked_props_freq[prop] = metrics.blocked_props_freq.get(prop, 0) + 1
+def calculate_metrics(results: list[ScenarioResult]) -> BenchmarkMetrics:
+    """Calculate aggregated metrics from scenario results"""
+    # Accumulate in locals and write the dataclass once
+    total_turns = 0
+    format_success = 0
+    thought_missing = 0
+    total_retries = 0
+    action_present = 0
+    action_sanitized = 0
+    blocked_props_freq = Counter()
 
-    return metrics
+    for result in results:
+        for turn in result.turns:
+            total_turns += 1
+            # bools add as 0/1
+            format_success += turn.format_valid
+            thought_missing += turn.thought_missing
+            total_retries += turn.retry_count
+            action_present += turn.action_present
+            action_sanitized += turn.action_sanitized
+            blocked_props_freq.update(turn.blocked_props)
+
+    return BenchmarkMetrics(
+        total_turns=total_turns,
+        format_success_count=format_success,
+        thought_missing_count=thought_missing,
+        total_retries=total_retries,
+        action_present_count=action_present,
+        action_sanitized_count=action_sanitized,
+        blocked_props_freq=blocked_props_freq,
+    )
 
 
 def check_thresholds(metrics: BenchmarkMetrics) -> tuple[bool, list[str]]:
@@ -414,12 +565,18 @@ def check_thresholds(metrics: BenchmarkMetrics) -> tuple[bool, list[str]]:
 def run_benchmark(
     scenarios: list[str],
     verbose: bool = False,
+    max_workers: Optional[int] = None,
 ) -> BenchmarkResult:
     """Run the full benchmark
 
+    Scenarios are independent and spend their time waiting on the LLM
+    backend, so they run concurrently in a thread pool.
+
     Args:
         scenarios: List of scenario names to run
-        verbose: Print detailed output
+        verbose: Print detailed output (lines are prefixed with the
+            scenario name)
+        max_workers: Concurrent scenarios (default: one per scenario)
 
     Returns:
         BenchmarkResult with all data
@@ -429,18 +586,29 @@ def run_benchmark(
         scenarios_run=scenarios,
     )
 
-    # Run each scenario
+    known_scenarios = []
     for scenario_name in scenarios:
         if scenario_name not in SCENARIOS:
             print(f"Warning: Unknown scenario '{scenario_name}', skipping")
             continue
+        known_scenarios.append(scenario_name)
 
-        scenario_result = run_scenario(
-            scenario_name,
-            SCENARIOS[scenario_name],
-            verbose=verbose,
-        )
-        result.results.append(scenario_result)
+    # Reset the global log store once, before any scenario thread starts
+    reset_log_store()
+
+    # Run scenarios concurrently; results keep the requested order.
+    # Log files are written by one background thread off the turn loop.
+    if known_scenarios:
+        log_writer = _BackgroundLogWriter()
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers or len(known_scenarios)) as executor:
+                futures = [
+                    executor.submit(run_scenario, name, SCENARIOS[name], verbose, log_writer)
+                    for name in known_scenarios
+                ]
+                result.results.extend(future.result() for future in futures)
+        finally:
+            log_writer.close()
 
     # Calculate metrics
     result.metrics = calculate_metrics(result.results)
@@ -475,6 +643,13 @@ def run_benchmark(
     return result
 
 
+def _dumps_json(obj: dict) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def print_report(result: BenchmarkResult) -> None:
     """Print formatted benchmark report"""
     print("\n" + "=" * 60)
@@ -535,6 +710,13 @@ def main():
         action="store_true",
         help="Show detailed output",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Scenarios run at once (default: one per scenario)",
+    )
     parser.add_argument(
         "--output-dir",
         type=Path,
@@ -542,6 +724,8 @@ def main():
         help="Directory to save results",
     )
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     # Determine scenarios to run
     if args.scenarios == "all":
@@ -555,13 +739,18 @@ def main():
     else:
         scenarios = list(SCENARIOS.keys())
 
+    if DUO_TALK_IMPORT_ERROR is not None:
+        print(f"Error: duo-talk packages not available: {DUO_TALK_IMPORT_ERROR}", file=sys.stderr)
+        sys.exit(2)
+
     # Run benchmark
     print("Starting regression mini-benchmark...")
-    result = run_benchmark(scenarios, verbose=args.verbose)
+    result = run_benchmark(scenarios, verbose=args.verbose, max_workers=args.workers)
 
-    # Output results
+    # Output results (serialized once, reused for the saved file)
+    payload = _dumps_json(result.to_dict())
     if args.json:
-        print(json.dumps(result.to_dict(), indent=2, ensure_ascii=False))
+        print(payload.decode("utf-8"))
     else:
         print_report(result)
 
@@ -569,8 +758,7 @@ def main():
     args.output_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = args.output_dir / f"benchmark_{timestamp}.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(result.to_dict(), f, indent=2, ensure_ascii=False)
+    output_file.write_bytes(payload)
     print(f"\nResults saved to: {output_file}")
 
     # Exit code based on threshold check
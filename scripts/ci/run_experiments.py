@@ -19,8 +19,13 @@ Exit codes:
 
 import argparse
 import json
+import re
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
@@ -44,6 +49,20 @@ EVALUATION_ROOT = Path(__file__).parent.parent.parent
 EXPERIMENTS_DIR = EVALUATION_ROOT / "experiments"
 RESULTS_DIR = EVALUATION_ROOT / "results"
 
+# Lines of experiment output kept for summary parsing (output is streamed)
+OUTPUT_TAIL_LINES = 200
+
+# Experiments run at once with "all" (timeouts are tuned for sequential
+# runs; --parallel opts in to more, scaling each timeout accordingly)
+DEFAULT_PARALLEL_EXPERIMENTS = 1
+
+# Keeps output lines of concurrent experiments from interleaving mid-line
+_PRINT_LOCK = threading.Lock()
+
+# Summary patterns in experiment stdout
+_RE_FORMAT = re.compile(r"format[=:]?\s*(\d+\.?\d*)%", re.IGNORECASE)
+_RE_RETRIES = re.compile(r"retries[=:]?\s*(\d+\.?\d*)", re.IGNORECASE)
+
 # Experiment configurations
 EXPERIMENTS = {
     "quick": {
@@ -75,12 +94,18 @@ EXPERIMENTS = {
 def run_experiment(
     experiment_name: str,
     extra_args: Optional[list[str]] = None,
+    prefix_output: bool = False,
+    timeout_scale: int = 1,
 ) -> ExperimentResult:
     """Run a single experiment
 
     Args:
         experiment_name: Name of experiment to run
         extra_args: Additional command-line arguments
+        prefix_output: Prefix output lines with the experiment name
+            (for concurrent runs)
+        timeout_scale: Multiplier for the configured timeout (the number
+            of experiments sharing the machine)
 
     Returns:
         ExperimentResult with status and summary
@@ -115,61 +140,80 @@ def run_experiment(
     if extra_args:
         cmd.extend(extra_args)
 
-    print(f"\n{'='*60}")
-    print(f"Running: {config['description']}")
-    print(f"Command: {' '.join(cmd)}")
-    print(f"{'='*60}\n")
+    with _PRINT_LOCK:
+        print(f"\n{'='*60}")
+        print(f"Running: {config['description']}")
+        print(f"Command: {' '.join(cmd)}")
+        print(f"{'='*60}\n")
+    line_prefix = f"[{experiment_name}] " if prefix_output else ""
+
+    start_ns = time.perf_counter_ns()
 
-    start_time = datetime.now()
+    timeout = config.get("timeout", 300) * timeout_scale
+    timed_out = threading.Event()
+    tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
 
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
             cwd=EVALUATION_ROOT,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=config.get("timeout", 300),
+            bufsize=1,
         )
-    except subprocess.TimeoutExpired:
+    except Exception as e:
         return ExperimentResult(
             experiment=experiment_name,
             success=False,
-            duration_seconds=config.get("timeout", 300),
+            duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
             output_dir=None,
             summary={},
-            error="Experiment timed out",
+            error=str(e),
         )
-    except Exception as e:
+
+    def _kill_on_timeout() -> None:
+        timed_out.set()
+        proc.kill()
+
+    # Stream output live; only the tail is kept for summary parsing
+    timer = threading.Timer(timeout, _kill_on_timeout)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            with _PRINT_LOCK:
+                print(line_prefix + line, end="")
+            tail.append(line)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+
+    if timed_out.is_set():
         return ExperimentResult(
             experiment=experiment_name,
             success=False,
-            duration_seconds=(datetime.now() - start_time).total_seconds(),
+            duration_seconds=timeout,
             output_dir=None,
             summary={},
-            error=str(e),
+            error="Experiment timed out",
         )
 
-    duration = (datetime.now() - start_time).total_seconds()
-
-    # Print output
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
 
     # Find output directory (most recent in results/)
     output_dir = _find_latest_result_dir(experiment_name)
 
     # Parse summary from output
-    summary = _parse_experiment_summary(result.stdout)
+    summary = _parse_experiment_summary("".join(tail))
 
     return ExperimentResult(
         experiment=experiment_name,
-        success=result.returncode == 0,
+        success=returncode == 0,
         duration_seconds=duration,
         output_dir=str(output_dir) if output_dir else None,
         summary=summary,
-        error=None if result.returncode == 0 else f"Exit code: {result.returncode}",
+        error=None if returncode == 0 else f"Exit code: {returncode}",
     )
 
 
@@ -201,16 +245,13 @@ def _parse_experiment_summary(output: str) -> dict:
     """
     summary = {}
 
-    # Look for common patterns
-    import re
-
     # Format success rate pattern
-    match = re.search(r"format[=:]?\s*(\d+\.?\d*)%", output, re.IGNORECASE)
+    match = _RE_FORMAT.search(output)
     if match:
         summary["format_success_rate"] = float(match.group(1))
 
     # Retries pattern
-    match = re.search(r"retries[=:]?\s*(\d+\.?\d*)", output, re.IGNORECASE)
+    match = _RE_RETRIES.search(output)
     if match:
         summary["avg_retries"] = float(match.group(1))
 
@@ -229,6 +270,13 @@ def main():
         action="store_true",
         help="Output as JSON",
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=DEFAULT_PARALLEL_EXPERIMENTS,
+        metavar="N",
+        help="Run up to N experiments at once with 'all' (timeouts scale by N)",
+    )
     parser.add_argument(
         "extra_args",
         nargs="*",
@@ -242,11 +290,22 @@ def main():
     else:
         experiments = [args.experiment]
 
-    # Run experiments
-    results = []
-    for exp in experiments:
-        result = run_experiment(exp, args.extra_args)
-        results.append(result)
+    if args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+
+    # Run experiments (independent processes, so "all" may run them
+    # concurrently when opted in with --parallel)
+    workers = min(len(experiments), args.parallel)
+    if workers == 1:
+        results = [run_experiment(exp, args.extra_args) for exp in experiments]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                lambda exp: run_experiment(
+                    exp, args.extra_args, prefix_output=True, timeout_scale=workers
+                ),
+                experiments,
+            ))
 
     # Output results
     all_success = all(r.success for r in results)
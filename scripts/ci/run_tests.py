@@ -4,7 +4,7 @@
 Runs all tests across the ecosystem and reports results in CI-friendly format.
 
 Usage:
-    python scripts/ci/run_tests.py [--component COMPONENT] [--coverage]
+    python scripts/ci/run_tests.py [--component COMPONENT] [--coverage] [--jobs N]
 
 Components:
     - all: Run all tests (default)
@@ -20,13 +20,26 @@ Exit codes:
 
 import argparse
 import json
+import os
+import re
 import subprocess
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# Try to import orjson for faster JSON output, fall back to stdlib json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 @dataclass
 class TestResult:
@@ -64,15 +77,30 @@ COMPONENTS = {
 }
 
 
+# pytest summary counts ("34 passed", "2 failed", "1 error", "3 errors", ...)
+_SUMMARY_RE = re.compile(r"(\d+) (passed|failed|error|skipped)")
+# pytest's final summary line is at the very end of the output
+_SUMMARY_TAIL_CHARS = 4096
+# Lines of pytest output kept (output is streamed, not buffered)
+OUTPUT_TAIL_LINES = 200
+PYTEST_TIMEOUT = 300
+# Bytecode (incl. pytest's assertion-rewritten test modules) is kept here
+# per component, outside the workdir, so collection reuses it across runs
+PYCACHE_ROOT = ECOSYSTEM_ROOT / ".pycache"
+_COVERAGE_TOTAL_RE = re.compile(r"TOTAL\s+\d+\s+\d+\s+\d+\s+\d+\s+(\d+)%")
+
+
 def run_pytest(
     component_path: Path,
     coverage: bool = False,
+    jobs: int = 1,
 ) -> TestResult:
     """Run pytest for a component
 
     Args:
         component_path: Path to component directory
         coverage: Whether to run with coverage
+        jobs: pytest-xdist workers per component (1 = no xdist, 0 = auto)
 
     Returns:
         TestResult with pass/fail counts
@@ -85,11 +113,19 @@ def run_pytest(
         "-m",
         "pytest",
         "tests/",
-        "-v",
-        "--tb=short",
         "-q",
+        "--no-header",
+        "--tb=no",
+        "-p",
+        "no:cacheprovider",
     ]
 
+    # Output is only parsed for the summary (and coverage TOTAL), so skip
+    # -v, the header, tracebacks and .pytest_cache writes
+    if jobs != 1:
+        # pytest-cov combines the per-worker coverage data itself
+        cmd.extend(["-n", "auto" if jobs <= 0 else str(jobs), "--dist=loadfile"])
+
     if coverage:
         cmd.extend([
             f"--cov=src/{component_path.name.replace('-', '_')}",
@@ -97,31 +133,52 @@ def run_pytest(
             "--cov-fail-under=70",
         ])
 
+    pycache_dir = PYCACHE_ROOT / component_path.name
+    pycache_dir.mkdir(parents=True, exist_ok=True)
+    env = {**os.environ, "PYTHONPYCACHEPREFIX": str(pycache_dir)}
+
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
             cwd=component_path,
-            capture_output=True,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=300,
-        )
-    except subprocess.TimeoutExpired:
-        return TestResult(
-            component=component_name,
-            passed=0,
-            failed=0,
-            errors=1,
-            skipped=0,
-            coverage=None,
-            duration_seconds=300.0,
-            success=False,
+            bufsize=1,
         )
+    except OSError:
+        return _error_result(component_name, 0.0)
+
+    timed_out = threading.Event()
+
+    def _kill_on_timeout() -> None:
+        timed_out.set()
+        proc.kill()
+
+    # Keep only the tail (summary) and the coverage TOTAL line in memory
+    tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    coverage_line = ""
+    timer = threading.Timer(PYTEST_TIMEOUT, _kill_on_timeout)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            tail.append(line)
+            if line.startswith("TOTAL"):
+                coverage_line = line
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+
+    if timed_out.is_set():
+        return _error_result(component_name, float(PYTEST_TIMEOUT))
 
     duration = (datetime.now() - start_time).total_seconds()
 
     # Parse pytest output
-    passed, failed, errors, skipped = _parse_pytest_output(result.stdout + result.stderr)
-    coverage_pct = _parse_coverage(result.stdout) if coverage else None
+    passed, failed, errors, skipped = _parse_pytest_output("".join(tail))
+    coverage_pct = _parse_coverage(coverage_line) if coverage else None
 
     return TestResult(
         component=component_name,
@@ -131,7 +188,21 @@ def run_pytest(
         skipped=skipped,
         coverage=coverage_pct,
         duration_seconds=duration,
-        success=result.returncode == 0,
+        success=returncode == 0,
+    )
+
+
+def _error_result(component_name: str, duration: float) -> TestResult:
+    """Result for a component whose pytest run could not finish"""
+    return TestResult(
+        component=component_name,
+        passed=0,
+        failed=0,
+        errors=1,
+        skipped=0,
+        coverage=None,
+        duration_seconds=duration,
+        success=False,
     )
 
 
@@ -141,35 +212,13 @@ def _parse_pytest_output(output: str) -> tuple[int, int, int, int]:
     Returns:
         Tuple of (passed, failed, errors, skipped)
     """
-    import re
-
-    # Match patterns like "34 passed", "2 failed", etc.
-    passed = 0
-    failed = 0
-    errors = 0
-    skipped = 0
-
-    patterns = {
-        "passed": r"(\d+) passed",
-        "failed": r"(\d+) failed",
-        "error": r"(\d+) error",
-        "skipped": r"(\d+) skipped",
-    }
-
-    for key, pattern in patterns.items():
-        match = re.search(pattern, output)
-        if match:
-            value = int(match.group(1))
-            if key == "passed":
-                passed = value
-            elif key == "failed":
-                failed = value
-            elif key == "error":
-                errors = value
-            elif key == "skipped":
-                skipped = value
-
-    return passed, failed, errors, skipped
+    counts = {"passed": 0, "failed": 0, "error": 0, "skipped": 0}
+
+    # One pass over the tail; the summary line is the last match
+    for match in _SUMMARY_RE.finditer(output[-_SUMMARY_TAIL_CHARS:]):
+        counts[match.group(2)] = int(match.group(1))
+
+    return counts["passed"], counts["failed"], counts["error"], counts["skipped"]
 
 
 def _parse_coverage(output: str) -> Optional[float]:
@@ -178,10 +227,8 @@ def _parse_coverage(output: str) -> Optional[float]:
     Returns:
         Coverage percentage or None
     """
-    import re
-
     # Match "TOTAL ... XX%" pattern
-    match = re.search(r"TOTAL\s+\d+\s+\d+\s+\d+\s+\d+\s+(\d+)%", output)
+    match = _COVERAGE_TOTAL_RE.search(output)
     if match:
         return float(match.group(1))
 
@@ -192,38 +239,54 @@ def run_all_tests(
     components: list[str],
     coverage: bool = False,
     json_output: bool = False,
+    jobs: int = 1,
 ) -> CIReport:
     """Run tests for all specified components
 
     Args:
         components: List of component names to test
         coverage: Whether to run with coverage
+        jobs: pytest-xdist workers per component (1 = no xdist, 0 = auto)
         json_output: If True, status messages go to stderr (for clean JSON stdout)
 
     Returns:
         CIReport with all results
     """
-    results = []
     # Use stderr for status when JSON output is requested
     out = sys.stderr if json_output else sys.stdout
 
+    known = []
     for comp in components:
         if comp not in COMPONENTS:
             print(f"Unknown component: {comp}", file=sys.stderr)
             continue
-
-        print(f"\n{'='*60}", file=out)
-        print(f"Running tests for: {comp}", file=out)
-        print(f"{'='*60}", file=out)
-
-        result = run_pytest(COMPONENTS[comp], coverage=coverage)
-        results.append(result)
-
-        status = "✅ PASSED" if result.success else "❌ FAILED"
-        print(f"\n{comp}: {status}", file=out)
-        print(f"  Passed: {result.passed}, Failed: {result.failed}, Errors: {result.errors}", file=out)
-        if result.coverage is not None:
-            print(f"  Coverage: {result.coverage:.1f}%", file=out)
+        known.append(comp)
+
+    # Components are independent pytest processes, so run them concurrently
+    results_by_comp: dict[str, TestResult] = {}
+    if known:
+        with ThreadPoolExecutor(max_workers=len(known)) as executor:
+            futures = {}
+            for comp in known:
+                print(f"\n{'='*60}", file=out)
+                print(f"Running tests for: {comp}", file=out)
+                print(f"{'='*60}", file=out)
+                futures[executor.submit(run_pytest, COMPONENTS[comp], coverage, jobs)] = comp
+
+            for future in as_completed(futures):
+                comp = futures[future]
+                result = future.result()
+                results_by_comp[comp] = result
+
+                # Status is printed from this (main) thread as each finishes
+                status = "✅ PASSED" if result.success else "❌ FAILED"
+                print(f"\n{comp}: {status}", file=out)
+                print(f"  Passed: {result.passed}, Failed: {result.failed}, Errors: {result.errors}", file=out)
+                if result.coverage is not None:
+                    print(f"  Coverage: {result.coverage:.1f}%", file=out)
+
+    # Report in the requested order, not completion order
+    results = [results_by_comp[comp] for comp in known]
 
     total_passed = sum(r.passed for r in results)
     total_failed = sum(r.failed for r in results)
@@ -240,6 +303,13 @@ def run_all_tests(
     )
 
 
+def _dumps_json(obj: dict) -> bytes:
+    """Serialize to 2-space indented JSON bytes with a trailing newline."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
 def main():
     parser = argparse.ArgumentParser(description="CI Test Runner")
     parser.add_argument(
@@ -253,6 +323,12 @@ def main():
         action="store_true",
         help="Run with coverage",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="pytest-xdist workers per component (0 = auto, requires pytest-xdist)",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -267,11 +343,16 @@ def main():
         components = [args.component]
 
     # Run tests
-    report = run_all_tests(components, coverage=args.coverage, json_output=args.json)
+    report = run_all_tests(
+        components, coverage=args.coverage, json_output=args.json, jobs=args.jobs
+    )
 
     # Output results
     if args.json:
-        print(json.dumps(asdict(report), indent=2, default=str))
+        # Report fields are all primitives (timestamp is already a string)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(_dumps_json(asdict(report)))
+        sys.stdout.flush()
     else:
         print(f"\n{'='*60}")
         print("SUMMARY")
@@ -14,12 +14,15 @@ Usage:
 import argparse
 import asyncio
 import csv
+import itertools
 import json
 import statistics
 import sys
 import time
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
 # Add project root to path
@@ -30,6 +33,11 @@ if str(PROJECT_ROOT) not in sys.path:
 from gui_nicegui.adapters import core_adapter, director_adapter
 from gui_nicegui.clients import gm_client
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 
 @dataclass
 class OneStepResult:
@@ -60,13 +68,18 @@ class LoadTestResult:
     latencies_ms: list[int] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
 
+    @cached_property
+    def _sorted_latencies(self) -> list[int]:
+        """Latencies sorted once; min/max/p95 all read from this."""
+        return sorted(self.latencies_ms)
+
     @property
     def min_latency(self) -> int:
-        return min(self.latencies_ms) if self.latencies_ms else 0
+        return self._sorted_latencies[0] if self.latencies_ms else 0
 
     @property
     def max_latency(self) -> int:
-        return max(self.latencies_ms) if self.latencies_ms else 0
+        return self._sorted_latencies[-1] if self.latencies_ms else 0
 
     @property
     def avg_latency(self) -> float:
@@ -76,20 +89,52 @@ class LoadTestResult:
     def p95_latency(self) -> float:
         if not self.latencies_ms:
             return 0.0
-        sorted_latencies = sorted(self.latencies_ms)
+        sorted_latencies = self._sorted_latencies
         idx = int(len(sorted_latencies) * 0.95)
         return sorted_latencies[min(idx, len(sorted_latencies) - 1)]
 
 
-async def run_one_step(speaker: str, topic: str, session_id: str) -> OneStepResult:
-    """Execute a single One-Step flow and measure latency."""
-    start_time = time.perf_counter()
+# Per-phase latency fields of OneStepResult, in flow order
+PHASE_LATENCY_FIELDS = (
+    "thought_latency_ms",
+    "director_thought_latency_ms",
+    "utterance_latency_ms",
+    "director_speech_latency_ms",
+    "gm_latency_ms",
+)
+
+
+def _elapsed_ms(start_ns: int) -> int:
+    """Milliseconds since a perf_counter_ns() start."""
+    return (time.perf_counter_ns() - start_ns) // 1_000_000
+
+
+def _fail(start_ns: int, error: str, phases: dict[str, int]) -> OneStepResult:
+    """Result for a run that stopped at an error, keeping phases measured so far."""
+    return OneStepResult(
+        success=False,
+        total_latency_ms=_elapsed_ms(start_ns),
+        error=error,
+        **phases,
+    )
+
+
+async def run_one_step(
+    speaker: str,
+    topic: str,
+    session_id: str,
+    gm_http_client: "httpx.AsyncClient | None" = None,
+) -> OneStepResult:
+    """Execute a single One-Step flow and measure latency.
 
-    thought_latency = 0
-    director_thought_latency = 0
-    utterance_latency = 0
-    director_speech_latency = 0
-    gm_latency = 0
+    Phases that share an input run concurrently, so the total is wall time
+    while each phase latency is that call's own latency.
+
+    gm_http_client is a shared AsyncClient so GM calls reuse pooled
+    connections instead of connecting per call.
+    """
+    start_ns = time.perf_counter_ns()
+    phases = dict.fromkeys(PHASE_LATENCY_FIELDS, 0)
 
     try:
         # Phase 1: Generate Thought
@@ -100,135 +145,132 @@ async def run_one_step(speaker: str, topic: str, session_id: str) -> OneStepResu
             timeout=30.0,  # Long timeout for real LLM
             history=[],
         )
-        thought_latency = thought_result["latency_ms"]
+        phases["thought_latency_ms"] = thought_result["latency_ms"]
         thought = thought_result["thought"]
 
-        # Phase 2: Director Check (Thought)
-        director_thought = await director_adapter.check(
-            stage="thought",
-            content=thought,
-            context={"speaker": speaker, "topic": topic, "turn_number": 1, "history": []},
-            timeout=10.0,
-        )
-        director_thought_latency = director_thought["latency_ms"]
-
-        # Phase 3: Generate Utterance
-        utterance_result = await core_adapter.generate_utterance(
-            session_id=session_id,
-            speaker=speaker,
-            thought=thought,
-            timeout=30.0,
-            history=[],
+        # Phases 2+3: the thought check and utterance generation both only
+        # need the thought, so they run concurrently
+        director_thought, utterance_result = await asyncio.gather(
+            director_adapter.check(
+                stage="thought",
+                content=thought,
+                context={"speaker": speaker, "topic": topic, "turn_number": 1, "history": []},
+                timeout=10.0,
+            ),
+            core_adapter.generate_utterance(
+                session_id=session_id,
+                speaker=speaker,
+                thought=thought,
+                timeout=30.0,
+                history=[],
+            ),
         )
-        utterance_latency = utterance_result["latency_ms"]
+        phases["director_thought_latency_ms"] = director_thought["latency_ms"]
+        phases["utterance_latency_ms"] = utterance_result["latency_ms"]
         utterance = utterance_result["speech"]
 
-        # Phase 4: Director Check (Speech)
-        director_speech = await director_adapter.check(
-            stage="speech",
-            content=utterance,
-            context={"speaker": speaker, "topic": topic, "turn_number": 1, "history": []},
-            timeout=10.0,
-        )
-        director_speech_latency = director_speech["latency_ms"]
-
-        # Phase 5: GM Step
-        gm_result = await gm_client.post_step(
-            payload={
-                "session_id": session_id,
-                "turn_number": 1,
-                "speaker": speaker,
-                "utterance": utterance,
-                "world_state": {},
-            },
-            timeout=5.0,
+        # Phases 4+5: the speech check and GM step both only need the utterance
+        director_speech, gm_result = await asyncio.gather(
+            director_adapter.check(
+                stage="speech",
+                content=utterance,
+                context={"speaker": speaker, "topic": topic, "turn_number": 1, "history": []},
+                timeout=10.0,
+            ),
+            gm_client.post_step(
+                payload={
+                    "session_id": session_id,
+                    "turn_number": 1,
+                    "speaker": speaker,
+                    "utterance": utterance,
+                    "world_state": {},
+                },
+                timeout=5.0,
+                client=gm_http_client,
+            ),
         )
-        gm_latency = gm_result["latency_ms"]
-
-        total_latency = int((time.perf_counter() - start_time) * 1000)
+        phases["director_speech_latency_ms"] = director_speech["latency_ms"]
+        phases["gm_latency_ms"] = gm_result["latency_ms"]
 
         return OneStepResult(
             success=True,
-            total_latency_ms=total_latency,
-            thought_latency_ms=thought_latency,
-            director_thought_latency_ms=director_thought_latency,
-            utterance_latency_ms=utterance_latency,
-            director_speech_latency_ms=director_speech_latency,
-            gm_latency_ms=gm_latency,
+            total_latency_ms=_elapsed_ms(start_ns),
             thought=thought,
             utterance=utterance,
             director_thought_status=director_thought["status"],
             director_speech_status=director_speech["status"],
+            **phases,
         )
 
     except asyncio.TimeoutError as e:
-        total_latency = int((time.perf_counter() - start_time) * 1000)
-        return OneStepResult(
-            success=False,
-            total_latency_ms=total_latency,
-            thought_latency_ms=thought_latency,
-            director_thought_latency_ms=director_thought_latency,
-            utterance_latency_ms=utterance_latency,
-            director_speech_latency_ms=director_speech_latency,
-            gm_latency_ms=gm_latency,
-            error=f"Timeout: {e}",
-        )
+        return _fail(start_ns, f"Timeout: {e}", phases)
     except Exception as e:
-        total_latency = int((time.perf_counter() - start_time) * 1000)
-        return OneStepResult(
-            success=False,
-            total_latency_ms=total_latency,
-            thought_latency_ms=thought_latency,
-            director_thought_latency_ms=director_thought_latency,
-            utterance_latency_ms=utterance_latency,
-            director_speech_latency_ms=director_speech_latency,
-            gm_latency_ms=gm_latency,
-            error=str(e),
-        )
+        return _fail(start_ns, str(e), phases)
 
 
 async def run_load_test(
     concurrent: int, iterations: int, speaker: str = "やな", topic: str = "朝の挨拶"
 ) -> tuple[LoadTestResult, list[OneStepResult]]:
     """Run load test with specified concurrency and iterations."""
-    all_results: list[OneStepResult] = []
-
     print(f"Starting load test: {concurrent} concurrent x {iterations} iterations")
     print(f"Speaker: {speaker}, Topic: {topic}")
     print("-" * 60)
 
-    for iteration in range(iterations):
-        print(f"Iteration {iteration + 1}/{iterations}...")
-
-        # Create concurrent tasks
-        tasks = []
-        for i in range(concurrent):
-            session_id = f"load_test_{iteration}_{i}"
-            tasks.append(run_one_step(speaker, topic, session_id))
-
-        # Execute concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                all_results.append(
-                    OneStepResult(
-                        success=False,
-                        total_latency_ms=0,
-                        thought_latency_ms=0,
-                        director_thought_latency_ms=0,
-                        utterance_latency_ms=0,
-                        director_speech_latency_ms=0,
-                        gm_latency_ms=0,
-                        error=str(result),
-                    )
+    # One pool of iterations x concurrent runs, at most `concurrent` in
+    # flight: a slow run no longer holds back the next iteration's runs
+    semaphore = asyncio.Semaphore(concurrent)
+
+    # One connection pool for every run's GM calls (core/director run in-process)
+    gm_http_client = None
+    if httpx is not None:
+        gm_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=concurrent * 2,
+                max_connections=concurrent * 4,
+            ),
+        )
+
+    async def run_slot(
+        iteration: int, i: int, session_id: str
+    ) -> tuple[int, int, OneStepResult]:
+        async with semaphore:
+            try:
+                result = await run_one_step(speaker, topic, session_id, gm_http_client)
+            except Exception as e:
+                result = OneStepResult(
+                    success=False,
+                    total_latency_ms=0,
+                    thought_latency_ms=0,
+                    director_thought_latency_ms=0,
+                    utterance_latency_ms=0,
+                    director_speech_latency_ms=0,
+                    gm_latency_ms=0,
+                    error=str(e),
                 )
-            else:
-                all_results.append(result)
+        return iteration, i, result
 
-            status = "✓" if (isinstance(result, OneStepResult) and result.success) else "✗"
-            latency = result.total_latency_ms if isinstance(result, OneStepResult) else 0
-            print(f"  [{status}] Task {i + 1}: {latency}ms")
+    # Slots and their session ids are built once, before any task starts
+    slots = list(itertools.product(range(iterations), range(concurrent)))
+    tasks = [
+        asyncio.create_task(run_slot(iteration, i, f"load_test_{iteration}_{i}"))
+        for iteration, i in slots
+    ]
+
+    # Report each run as it finishes
+    results_by_slot: dict[tuple[int, int], OneStepResult] = {}
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            iteration, i, result = await next_done
+            results_by_slot[(iteration, i)] = result
+
+            status = "✓" if result.success else "✗"
+            print(f"  [{status}] Iteration {iteration + 1}/{iterations} Task {i + 1}: {result.total_latency_ms}ms")
+    finally:
+        if gm_http_client is not None:
+            await gm_http_client.aclose()
+
+    # Keep results in iteration/task order for the CSV
+    all_results = [results_by_slot[slot] for slot in slots]
 
     # Aggregate results
     successful = [r for r in all_results if r.success]
@@ -246,35 +288,29 @@ async def run_load_test(
     return load_result, all_results
 
 
+# CSV columns (OneStepResult attributes)
+CSV_COLUMNS = (
+    "success",
+    "total_latency_ms",
+    "thought_latency_ms",
+    "director_thought_latency_ms",
+    "utterance_latency_ms",
+    "director_speech_latency_ms",
+    "gm_latency_ms",
+    "director_thought_status",
+    "director_speech_status",
+    "error",
+)
+
+
 def save_csv(results: list[OneStepResult], output_path: Path) -> None:
     """Save results to CSV file."""
     with open(output_path, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
-        writer.writerow([
-            "success",
-            "total_latency_ms",
-            "thought_latency_ms",
-            "director_thought_latency_ms",
-            "utterance_latency_ms",
-            "director_speech_latency_ms",
-            "gm_latency_ms",
-            "director_thought_status",
-            "director_speech_status",
-            "error",
-        ])
-        for r in results:
-            writer.writerow([
-                r.success,
-                r.total_latency_ms,
-                r.thought_latency_ms,
-                r.director_thought_latency_ms,
-                r.utterance_latency_ms,
-                r.director_speech_latency_ms,
-                r.gm_latency_ms,
-                r.director_thought_status,
-                r.director_speech_status,
-                r.error,
-            ])
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows(
+            tuple(getattr(r, column) for column in CSV_COLUMNS) for r in results
+        )
     print(f"Results saved to {output_path}")
 
 
@@ -315,12 +351,21 @@ def save_report(
 
 """
     if load_result.successful_runs > 0:
-        successful = [r for r in results if r.success]
-        avg_thought = statistics.mean([r.thought_latency_ms for r in successful])
-        avg_dir_thought = statistics.mean([r.director_thought_latency_ms for r in successful])
-        avg_utterance = statistics.mean([r.utterance_latency_ms for r in successful])
-        avg_dir_speech = statistics.mean([r.director_speech_latency_ms for r in successful])
-        avg_gm = statistics.mean([r.gm_latency_ms for r in successful])
+        # One pass over results, summing every phase at once
+        n = thought = dir_thought = utterance = dir_speech = gm = 0
+        for r in results:
+            if r.success:
+                n += 1
+                thought += r.thought_latency_ms
+                dir_thought += r.director_thought_latency_ms
+                utterance += r.utterance_latency_ms
+                dir_speech += r.director_speech_latency_ms
+                gm += r.gm_latency_ms
+        avg_thought = thought / n
+        avg_dir_thought = dir_thought / n
+        avg_utterance = utterance / n
+        avg_dir_speech = dir_speech / n
+        avg_gm = gm / n
 
         report += f"""| Phase | Avg Latency |
 |-------|-------------|
@@ -334,10 +379,7 @@ def save_report(
 
     if load_result.errors:
         report += "## Errors\n\n"
-        error_counts: dict[str, int] = {}
-        for error in load_result.errors:
-            error_counts[error] = error_counts.get(error, 0) + 1
-        for error, count in sorted(error_counts.items(), key=lambda x: -x[1]):
+        for error, count in Counter(load_result.errors).most_common():
             report += f"- ({count}x) {error}\n"
         report += "\n"
 
@@ -389,8 +431,8 @@ def main():
 
     if load_result.errors:
         print(f"\nErrors ({len(load_result.errors)}):")
-        for error in set(load_result.errors)[:5]:
-            print(f"  - {error}")
+        for error, count in Counter(load_result.errors).most_common(5):
+            print(f"  - ({count}x) {error}")
 
     # Save outputs
     if args.output:
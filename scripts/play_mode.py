@@ -9,12 +9,34 @@ import hashlib
 import json
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import TypedDict
+from typing import Callable, Iterable, NotRequired, TypedDict
+
+# Try to import orjson for faster JSON handling, fall back to stdlib json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Fuzzy matching backend for object suggestions, imported on first use
+# (see _get_fuzzy_backend): (process, fuzz) from rapidfuzz, or () for difflib
+_fuzzy_backend: tuple | None = None
 
 # Default save path for state files
 DEFAULT_STATE_PATH = Path("artifacts/scn_mystery_mansion_v1_state.json")
 
+# Save schema versions: 1.0.0 embeds scenario_data, 1.1.0 references the
+# scenario file (absolute path + SHA-256 of its bytes)
+EMBEDDED_SCHEMA_VERSION = "1.0.0"
+REFERENCE_SCHEMA_VERSION = "1.1.0"
+
+
+class ScenarioReferenceError(Exception):
+    """A save's referenced scenario file is missing or has changed."""
+
 
 # =============================================================================
 # Type Definitions
@@ -32,6 +54,9 @@ class PlayState(TypedDict):
     holding: list[str]
     scenario_data: dict
     unlocked_doors: list[str]  # Doors that have been unlocked
+    scenario_path: NotRequired[str | None]  # Source file, referenced by saves
+    scenario_sha256: NotRequired[str | None]  # Hash of the source file as loaded
+    consumed_hidden_locations: NotRequired[list[str]]  # Locations already searched
 
 
 class ParsedCommand(TypedDict):
@@ -46,6 +71,73 @@ class ParsedCommand(TypedDict):
 # =============================================================================
 
 
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_canonical(obj) -> bytes:
+    """Serialize to canonical JSON bytes (sorted keys, 2-space indent, trailing newline)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+    return (json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+@lru_cache(maxsize=32)
+def _read_scenario(path_str: str, mtime_ns: int, size: int) -> tuple[dict, str]:
+    """Parse a scenario file and hash its bytes, cached per (path, mtime, size).
+
+    The returned dict is shared between calls. Play mode never mutates
+    scenario_data in place (commands build updated copies), so sharing is
+    safe; editing the file changes the key and forces a re-read.
+    """
+    content = Path(path_str).read_bytes()
+    return _intern_names(_json_loads(content)), hashlib.sha256(content).hexdigest()
+
+
+def _intern_names(obj):
+    """Intern dict keys and list strings throughout parsed scenario data.
+
+    Location, exit, door and object names are used as dict keys and as
+    lookup values (exits, props), so interning lets dict probes match on
+    identity. Free-text values (descriptions, hints) are left as is.
+    Runs once per scenario file because the result is cached.
+    """
+    if isinstance(obj, dict):
+        return {
+            (sys.intern(key) if isinstance(key, str) else key): _intern_names(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [
+            sys.intern(item) if isinstance(item, str) else _intern_names(item)
+            for item in obj
+        ]
+    return obj
+
+
+def _load_scenario_file(scenario_path: Path) -> tuple[dict, str]:
+    """Read a scenario file through the (path, mtime, size) cache.
+
+    Returns:
+        Tuple of (scenario data, SHA-256 hex digest of the file bytes)
+
+    Raises:
+        FileNotFoundError: If scenario file doesn't exist
+    """
+    try:
+        stat = scenario_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Scenario not found: {scenario_path}") from None
+
+    return _read_scenario(str(scenario_path), stat.st_mtime_ns, stat.st_size)
+
+
 def load_scenario_for_play(scenario_path: Path) -> PlayState:
     """Load scenario and prepare initial play state.
 
@@ -58,10 +150,7 @@ def load_scenario_for_play(scenario_path: Path) -> PlayState:
     Raises:
         FileNotFoundError: If scenario file doesn't exist
     """
-    if not scenario_path.exists():
-        raise FileNotFoundError(f"Scenario not found: {scenario_path}")
-
-    scenario = json.loads(scenario_path.read_text(encoding="utf-8"))
+    scenario, scenario_hash = _load_scenario_file(scenario_path)
 
     # Extract character positions
     characters = scenario.get("characters", {})
@@ -83,12 +172,16 @@ def load_scenario_for_play(scenario_path: Path) -> PlayState:
     return PlayState(
         scenario_name=scenario.get("name", "unnamed"),
         current_location=yana_location,
-        available_objects=current_loc_data.get("props", []),
-        available_exits=current_loc_data.get("exits", []),
+        # Own lists, so callers can't reach into the cached scenario
+        available_objects=list(current_loc_data.get("props", [])),
+        available_exits=list(current_loc_data.get("exits", [])),
         character_positions=character_positions,
         holding=[],
         scenario_data=scenario,
         unlocked_doors=[],
+        scenario_path=str(scenario_path.resolve()),
+        scenario_sha256=scenario_hash,
+        consumed_hidden_locations=[],
     )
 
 
@@ -108,45 +201,39 @@ def format_world_state(state: PlayState) -> str:
     Returns:
         Formatted string for display
     """
-    lines = [
-        f"=== {state['scenario_name']} ===",
-        f"",
-        f"📍 現在地: {state['current_location']}",
-        f"",
-        f"🎒 所持品: {', '.join(state['holding']) or '(なし)'}",
-        f"",
-        f"📦 オブジェクト:",
-    ]
-
-    for obj in state["available_objects"]:
-        lines.append(f"  - {obj}")
-
-    if not state["available_objects"]:
-        lines.append("  (なし)")
-
-    lines.append(f"")
-    lines.append(f"🚪 出口:")
+    objects = state["available_objects"]
+    objects_section = "\n".join(f"  - {obj}" for obj in objects) if objects else "  (なし)"
 
     # Get locked exits info for door mapping display (BUG-004)
     locations = state["scenario_data"].get("locations", {})
     current_loc_data = locations.get(state["current_location"], {})
     locked_exits = current_loc_data.get("locked_exits", {})
+    unlocked_doors = state.get("unlocked_doors", [])
 
+    exit_lines = []
     for exit_loc in state["available_exits"]:
         # Check if this exit has a locked door
         if exit_loc in locked_exits:
-            lock_info = locked_exits[exit_loc]
-            door_name = lock_info.get("door_name", exit_loc)
-            is_unlocked = door_name in state.get("unlocked_doors", [])
-            lock_icon = "🔓" if is_unlocked else "🔒"
-            lines.append(f"  - {exit_loc} (via {door_name} {lock_icon})")
+            door_name = locked_exits[exit_loc].get("door_name", exit_loc)
+            lock_icon = "🔓" if door_name in unlocked_doors else "🔒"
+            exit_lines.append(f"  - {exit_loc} (via {door_name} {lock_icon})")
         else:
-            lines.append(f"  - {exit_loc}")
-
-    if not state["available_exits"]:
-        lines.append("  (なし)")
-
-    return "\n".join(lines)
+            exit_lines.append(f"  - {exit_loc}")
+    exits_section = "\n".join(exit_lines) if exit_lines else "  (なし)"
+
+    return (
+        f"=== {state['scenario_name']} ===\n"
+        "\n"
+        f"📍 現在地: {state['current_location']}\n"
+        "\n"
+        f"🎒 所持品: {', '.join(state['holding']) or '(なし)'}\n"
+        "\n"
+        "📦 オブジェクト:\n"
+        f"{objects_section}\n"
+        "\n"
+        "🚪 出口:\n"
+        f"{exits_section}"
+    )
 
 
 def format_character_status(positions: dict[str, str]) -> str:
@@ -187,27 +274,44 @@ def save_play_state(state: PlayState, path: Path | None = None) -> Path:
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create saveable data (exclude non-serializable scenario_data reference)
     save_data = {
-        "schema_version": "1.0.0",
+        "schema_version": EMBEDDED_SCHEMA_VERSION,
         "saved_at": datetime.now().isoformat(),
         "scenario_name": state["scenario_name"],
         "current_location": state["current_location"],
         "holding": state["holding"],
         "unlocked_doors": state["unlocked_doors"],
-        "scenario_data": state["scenario_data"],  # Include full scenario state
+        "consumed_hidden_locations": state.get("consumed_hidden_locations", []),
     }
 
+    # scenario_data is read-only during play, so reference the scenario
+    # file while it still holds what the session loaded; otherwise (file
+    # missing or edited since, or a legacy save) embed the full scenario
+    scenario_path = state.get("scenario_path")
+    loaded_hash = state.get("scenario_sha256")
+    current_hash = None
+    if scenario_path and loaded_hash:
+        # Absolute, so the save loads from any working directory
+        scenario_path = str(Path(scenario_path).resolve())
+        try:
+            _, current_hash = _load_scenario_file(Path(scenario_path))
+        except (FileNotFoundError, ValueError):
+            current_hash = None
+    if current_hash is not None and current_hash == loaded_hash:
+        save_data["schema_version"] = REFERENCE_SCHEMA_VERSION
+        save_data["scenario_ref"] = scenario_path
+        save_data["scenario_sha256"] = loaded_hash
+    else:
+        save_data["scenario_data"] = state["scenario_data"]
+
     # Serialize to canonical JSON (sorted keys for reproducibility)
-    content = json.dumps(save_data, ensure_ascii=False, indent=2, sort_keys=True)
-    if not content.endswith("\n"):
-        content += "\n"
+    content = _json_dumps_canonical(save_data)
 
     # Write state file
-    path.write_text(content, encoding="utf-8")
+    path.write_bytes(content)
 
-    # Write hash file for hakoniwa CLI compatibility
-    content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    # Write hash file for hakoniwa CLI compatibility (same bytes as written)
+    content_hash = hashlib.sha256(content).hexdigest()
     hash_path = Path(str(path) + ".sha256")
     hash_path.write_text(content_hash, encoding="utf-8")
 
@@ -225,14 +329,29 @@ def load_play_state(path: Path) -> PlayState:
 
     Raises:
         FileNotFoundError: If file doesn't exist
+        ScenarioReferenceError: If the referenced scenario file is missing or
+            no longer matches the hash recorded at save time
     """
     if not path.exists():
         raise FileNotFoundError(f"State file not found: {path}")
 
-    save_data = json.loads(path.read_text(encoding="utf-8"))
+    save_data = _json_loads(path.read_bytes())
 
-    # Reconstruct PlayState
-    scenario_data = save_data["scenario_data"]
+    # Reconstruct PlayState (legacy 1.0.0 saves embed the full scenario_data)
+    scenario_path = save_data.get("scenario_ref")
+    if scenario_path is not None:
+        try:
+            scenario_data, scenario_hash = _load_scenario_file(Path(scenario_path))
+        except FileNotFoundError:
+            raise ScenarioReferenceError(
+                f"Referenced scenario not found: {scenario_path}"
+            ) from None
+        if scenario_hash != save_data["scenario_sha256"]:
+            raise ScenarioReferenceError(
+                f"Referenced scenario has changed since the save: {scenario_path}"
+            )
+    else:
+        scenario_data = save_data["scenario_data"]
     locations = scenario_data.get("locations", {})
     current_location = save_data["current_location"]
     current_loc_data = locations.get(current_location, {})
@@ -240,8 +359,8 @@ def load_play_state(path: Path) -> PlayState:
     return PlayState(
         scenario_name=save_data["scenario_name"],
         current_location=current_location,
-        available_objects=current_loc_data.get("props", []),
-        available_exits=current_loc_data.get("exits", []),
+        available_objects=list(current_loc_data.get("props", [])),
+        available_exits=list(current_loc_data.get("exits", [])),
         character_positions={
             name: data.get("location", "不明")
             for name, data in scenario_data.get("characters", {}).items()
@@ -249,6 +368,9 @@ def load_play_state(path: Path) -> PlayState:
         holding=save_data["holding"],
         scenario_data=scenario_data,
         unlocked_doors=save_data["unlocked_doors"],
+        scenario_path=scenario_path,
+        scenario_sha256=save_data.get("scenario_sha256"),
+        consumed_hidden_locations=save_data.get("consumed_hidden_locations", []),
     )
 
 
@@ -275,6 +397,14 @@ COMMAND_ALIASES: dict[str, list[str]] = {
     "load": ["load", "ロード", "読み込み"],
 }
 
+# Reverse lookup: alias -> command (built once; aliases are unique)
+_ALIAS_TO_CMD: dict[str, str] = {
+    alias: cmd for cmd, aliases in COMMAND_ALIASES.items() for alias in aliases
+}
+
+# Commands that don't use targets
+_NO_TARGET_CMDS = frozenset({"where", "inventory", "map", "help", "quit", "status"})
+
 # Direction aliases for movement (location-specific)
 # Maps direction -> exit name by current location
 DIRECTION_ALIASES: dict[str, dict[str, str]] = {
@@ -294,6 +424,13 @@ DIRECTION_ALIASES: dict[str, dict[str, str]] = {
     },
 }
 
+# (location, direction) -> exit name, flattened from DIRECTION_ALIASES
+_DIRECTION_TO_EXIT: dict[tuple[str, str], str] = {
+    (location, direction): exit_name
+    for location, directions in DIRECTION_ALIASES.items()
+    for direction, exit_name in directions.items()
+}
+
 
 def parse_command(user_input: str) -> ParsedCommand:
     """Parse user input into command.
@@ -318,24 +455,41 @@ def parse_command(user_input: str) -> ParsedCommand:
     target = parts[1] if len(parts) > 1 else None
 
     # Normalize commands using alias dictionary
-    for cmd, aliases in COMMAND_ALIASES.items():
-        if action in aliases:
-            # Commands that don't use targets
-            if cmd in ("where", "inventory", "map", "help", "quit", "status"):
-                return ParsedCommand(action=cmd, target=None)
-            # save/load use optional path
-            if cmd in ("save", "load"):
-                return ParsedCommand(action=cmd, target=target)
-            return ParsedCommand(action=cmd, target=target)
+    cmd = _ALIAS_TO_CMD.get(action)
+    if cmd is None:
+        return ParsedCommand(action="unknown", target=user_input)
+    if cmd in _NO_TARGET_CMDS:
+        return ParsedCommand(action=cmd, target=None)
+    # save/load use an optional path, other commands an optional target
+    return ParsedCommand(action=cmd, target=target)
+
+
+def _get_fuzzy_backend() -> tuple:
+    """Import the fuzzy matching backend the first time it is needed.
 
-    return ParsedCommand(action="unknown", target=user_input)
+    Most sessions never search for a missing object, so play mode starts
+    without importing rapidfuzz (or difflib).
+
+    Returns:
+        (process, fuzz) from rapidfuzz, or () when only difflib is available
+    """
+    global _fuzzy_backend
+    if _fuzzy_backend is None:
+        try:
+            from rapidfuzz import fuzz, process
+
+            _fuzzy_backend = (process, fuzz)
+        except ImportError:
+            _fuzzy_backend = ()
+    return _fuzzy_backend
 
 
 def _find_similar_objects(query: str, candidates: list[str], threshold: float = 0.5) -> list[str]:
     """Find similar objects using basic fuzzy matching.
 
     P2: BUG-006 - Semantic Matcher verification path.
-    Uses simple substring/prefix matching and difflib for suggestions.
+    Uses simple substring/prefix matching, then rapidfuzz (or difflib)
+    similarity for suggestions.
 
     Args:
         query: The search query
@@ -345,22 +499,32 @@ def _find_similar_objects(query: str, candidates: list[str], threshold: float =
     Returns:
         List of similar object names (deduplicated)
     """
-    import difflib
-
     suggestions = []
 
     # First, check for substring matches
     query_lower = query.lower()
     for candidate in candidates:
-        if query_lower in candidate.lower() or candidate.lower() in query_lower:
+        candidate_lower = candidate.lower()
+        if query_lower in candidate_lower or candidate_lower in query_lower:
             suggestions.append(candidate)
 
-    # If no substring matches, use difflib
+    # If no substring matches, fall back to similarity ratio
     if not suggestions:
-        close_matches = difflib.get_close_matches(
-            query, candidates, n=2, cutoff=threshold
-        )
-        suggestions.extend(close_matches)
+        backend = _get_fuzzy_backend()
+        if backend:
+            process, fuzz = backend
+            # Same ratio as difflib's, scaled 0-100
+            close_matches = process.extract(
+                query, candidates, scorer=fuzz.ratio, limit=2, score_cutoff=threshold * 100
+            )
+            suggestions.extend(match[0] for match in close_matches)
+        else:
+            import difflib
+
+            close_matches = difflib.get_close_matches(
+                query, candidates, n=2, cutoff=threshold
+            )
+            suggestions.extend(close_matches)
 
     # Deduplicate while preserving order
     seen = set()
@@ -373,6 +537,49 @@ def _find_similar_objects(query: str, candidates: list[str], threshold: float =
     return unique_suggestions[:2]  # Return max 2 suggestions
 
 
+# Common typos and suggestions
+_TYPO_SUGGESTIONS: dict[str, str] = {
+    "lok": "look",
+    "loo": "look",
+    "mve": "move",
+    "mov": "move",
+    "tke": "take",
+    "tak": "take",
+    "opn": "open",
+    "serch": "search",
+    "srch": "search",
+    "wher": "where",
+    "invent": "inventory",
+    "invetory": "inventory",
+    "mp": "map",
+    "hlp": "help",
+    "hep": "help",
+    "ext": "quit",
+    "exi": "quit",
+}
+
+
+def _build_alias_trie(aliases: Iterable[str]) -> dict:
+    """Build a prefix trie over command aliases.
+
+    Each node maps a character to its child node. The "" key holds the
+    first alias (in COMMAND_ALIASES order) under that prefix, so a lookup
+    walks len(prefix) nodes and never searches below them.
+    """
+    root: dict = {}
+    for alias in aliases:
+        node = root
+        for char in alias:
+            node = node.setdefault(char, {})
+            node.setdefault("", alias)
+    return root
+
+
+_ALIAS_TRIE = _build_alias_trie(
+    alias for aliases in COMMAND_ALIASES.values() for alias in aliases
+)
+
+
 def suggest_command(user_input: str) -> str | None:
     """Suggest a similar command for typos or unknown input.
 
@@ -387,46 +594,24 @@ def suggest_command(user_input: str) -> str | None:
 
     action = user_input.split()[0].lower()
 
-    # Common typos and suggestions
-    suggestions: dict[str, str] = {
-        "lok": "look",
-        "loo": "look",
-        "mve": "move",
-        "mov": "move",
-        "tke": "take",
-        "tak": "take",
-        "opn": "open",
-        "serch": "search",
-        "srch": "search",
-        "wher": "where",
-        "invent": "inventory",
-        "invetory": "inventory",
-        "mp": "map",
-        "hlp": "help",
-        "hep": "help",
-        "ext": "quit",
-        "exi": "quit",
-    }
-
-    if action in suggestions:
-        return f"もしかして: {suggestions[action]}"
+    # An exact typo hit wins
+    if action in _TYPO_SUGGESTIONS:
+        return f"もしかして: {_TYPO_SUGGESTIONS[action]}"
 
     # Check if it starts like a known command
-    for cmd, aliases in COMMAND_ALIASES.items():
-        for alias in aliases:
-            if len(action) >= 2 and alias.startswith(action):
-                return f"もしかして: {alias}"
+    if len(action) >= 2:
+        node = _ALIAS_TRIE
+        for char in action:
+            node = node.get(char)
+            if node is None:
+                return None
+        return f"もしかして: {node['']}"
 
     return None
 
 
-def get_help_text() -> str:
-    """Get help text with available commands.
-
-    Returns:
-        Help text string
-    """
-    return """
+# Static help text (see get_help_text)
+_HELP_TEXT = """
 📖 コマンド一覧
 
 【探索】
@@ -467,370 +652,449 @@ def get_help_text() -> str:
 """
 
 
+def get_help_text() -> str:
+    """Get help text with available commands.
+
+    Returns:
+        Help text string
+    """
+    return _HELP_TEXT
+
+
 # =============================================================================
 # Command Execution
 # =============================================================================
 
 
-def execute_command(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
-    """Execute a parsed command and return result.
+# door_name -> exit_name per locked_exits dict, keyed by id(). The dict is
+# kept in the entry so its id can't be reused while cached.
+_DOOR_INDEX_CACHE: dict[int, tuple[dict, dict[str, str]]] = {}
+_DOOR_INDEX_CACHE_SIZE = 64
 
-    Args:
-        cmd: Parsed command
-        state: Current play state
 
-    Returns:
-        Tuple of (output message, updated state)
+def _door_name_index(locked_exits: dict) -> dict[str, str]:
+    """Map each door_name to its exit_name for one location's locked exits.
+
+    Scenario data is never mutated in place (commands build copies), so the
+    index for a given locked_exits dict stays valid while it is cached.
     """
-    if cmd["action"] == "look":
-        return format_world_state(state), state
+    if not locked_exits:
+        return {}
 
-    elif cmd["action"] == "status":
-        # Show full play state (location/inventory/exits/locks) + character positions
-        world_info = format_world_state(state)
-        char_info = format_character_status(state["character_positions"])
-        return f"{world_info}\n\n{char_info}", state
+    cached = _DOOR_INDEX_CACHE.get(id(locked_exits))
+    if cached is not None and cached[0] is locked_exits:
+        return cached[1]
 
-    elif cmd["action"] == "help":
-        return get_help_text(), state
+    index: dict[str, str] = {}
+    for exit_name, info in locked_exits.items():
+        door_name = info.get("door_name")
+        if door_name is not None:
+            # First exit wins, as with the previous linear scan
+            index.setdefault(door_name, exit_name)
+
+    if len(_DOOR_INDEX_CACHE) >= _DOOR_INDEX_CACHE_SIZE:
+        _DOOR_INDEX_CACHE.clear()
+    _DOOR_INDEX_CACHE[id(locked_exits)] = (locked_exits, index)
+    return index
+
+
+def _replace_state(state: PlayState, **changes) -> PlayState:
+    """Return a new state with the given fields replaced.
+
+    Unchanged fields are shared with the original state; commands never
+    mutate a state in place.
+    """
+    return PlayState(**{**state, **changes})
+
+
+def _cmd_look(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Show the world state."""
+    return format_world_state(state), state
+
+
+def _cmd_status(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Show the world state plus character positions."""
+    # Show full play state (location/inventory/exits/locks) + character positions
+    world_info = format_world_state(state)
+    char_info = format_character_status(state["character_positions"])
+    return f"{world_info}\n\n{char_info}", state
 
-    elif cmd["action"] == "save":
-        # P0: BUG-001 Save/Load blocker fix
-        path = Path(cmd["target"]) if cmd["target"] else None
-        try:
-            saved_path = save_play_state(state, path)
-            return f"💾 セーブ完了: {saved_path.absolute()}", state
-        except Exception as e:
-            return f"❌ セーブ失敗: {e}", state
-
-    elif cmd["action"] == "load":
-        # P0: BUG-001 Save/Load blocker fix
-        path = Path(cmd["target"]) if cmd["target"] else DEFAULT_STATE_PATH
-        try:
-            new_state = load_play_state(path)
-            return f"📂 ロード完了: {path}\n\n{format_world_state(new_state)}", new_state
-        except FileNotFoundError:
-            return f"❌ ファイルが見つかりません: {path}", state
-        except Exception as e:
-            return f"❌ ロード失敗: {e}", state
 
-    elif cmd["action"] == "move":
-        target = cmd["target"]
-        if not target:
-            return "移動先を指定してください (例: move リビング)", state
+def _cmd_help(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Show the command list."""
+    return _HELP_TEXT, state
 
-        # P1: BUG-005 - Resolve direction aliases (up, north, etc.)
-        current_loc = state["current_location"]
+
+def _cmd_save(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Save the play state to the target path (or the default)."""
+    # P0: BUG-001 Save/Load blocker fix
+    path = Path(cmd["target"]) if cmd["target"] else None
+    try:
+        saved_path = save_play_state(state, path)
+        return f"💾 セーブ完了: {saved_path.absolute()}", state
+    except Exception as e:
+        return f"❌ セーブ失敗: {e}", state
+
+
+def _cmd_load(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Load a saved play state from the target path (or the default)."""
+    # P0: BUG-001 Save/Load blocker fix
+    path = Path(cmd["target"]) if cmd["target"] else DEFAULT_STATE_PATH
+    try:
+        new_state = load_play_state(path)
+        return f"📂 ロード完了: {path}\n\n{format_world_state(new_state)}", new_state
+    except ScenarioReferenceError as e:
+        return f"❌ シナリオを読み込めません: {e}", state
+    except FileNotFoundError:
+        return f"❌ ファイルが見つかりません: {path}", state
+    except Exception as e:
+        return f"❌ ロード失敗: {e}", state
+
+
+def _cmd_move(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Move to an exit, resolving direction aliases and locked doors."""
+    target = cmd["target"]
+    if not target:
+        return "移動先を指定してください (例: move リビング)", state
+
+    # P1: BUG-005 - Resolve direction aliases (up, north, etc.)
+    current_loc = state["current_location"]
+    target = _DIRECTION_TO_EXIT.get((current_loc, target.lower()), target)
+
+    if target not in state["available_exits"]:
+        # Show user-friendly directions instead of raw exit names
         if current_loc in DIRECTION_ALIASES:
-            target = DIRECTION_ALIASES[current_loc].get(target.lower(), target)
-
-        if target not in state["available_exits"]:
-            # Show user-friendly directions instead of raw exit names
-            if current_loc in DIRECTION_ALIASES:
-                # Build direction -> exit mapping for display
-                dir_to_exit: dict[str, str] = {}
-                for direction, exit_name in DIRECTION_ALIASES[current_loc].items():
-                    # Skip short aliases (n, s, u, d) - only show full names
-                    if len(direction) > 1:
-                        dir_to_exit[direction] = exit_name
-
-                if dir_to_exit:
-                    # Format: "north → locked_study, up → goal_attic"
-                    dir_hints = [f"{d} → {e}" for d, e in dir_to_exit.items()]
-                    return f"'{cmd['target']}' には移動できません。利用可能な方角: {', '.join(dir_hints)}", state
-
-            # Fallback: show exit names directly
-            available = ", ".join(state["available_exits"])
-            return f"'{cmd['target']}' には移動できません。移動可能: {available}", state
-
-        # Check for locked exits (Preflight check)
-        locations = state["scenario_data"].get("locations", {})
-        current_loc_data = locations.get(state["current_location"], {})
-        locked_exits = current_loc_data.get("locked_exits", {})
-
-        if target in locked_exits:
-            lock_info = locked_exits[target]
-            door_name = lock_info.get("door_name", target)
-
-            # Check if door is still locked
-            if lock_info.get("locked", False) and door_name not in state["unlocked_doors"]:
-                # Preflight: Locked door - give hints, not hard deny
-                hint = lock_info.get("hint_on_locked", "施錠されています。")
-                suggestions = lock_info.get("suggestions", ["look around"])
-                suggestions_str = " / ".join(suggestions)
-
-                return (
-                    f"[PREFLIGHT] 🔒 {door_name} は施錠されています。{hint}\n"
-                    f"💡 次の行動候補: {suggestions_str}"
-                ), state
-
-        # Update location
-        new_loc_data = locations.get(target, {})
-
-        new_state = PlayState(
-            scenario_name=state["scenario_name"],
-            current_location=target,
-            available_objects=new_loc_data.get("props", []),
-            available_exits=new_loc_data.get("exits", []),
-            character_positions=state["character_positions"],
-            holding=state["holding"],
-            scenario_data=state["scenario_data"],
-            unlocked_doors=state["unlocked_doors"],
-        )
+            # Build direction -> exit mapping for display
+            dir_to_exit: dict[str, str] = {}
+            for direction, exit_name in DIRECTION_ALIASES[current_loc].items():
+                # Skip short aliases (n, s, u, d) - only show full names
+                if len(direction) > 1:
+                    dir_to_exit[direction] = exit_name
+
+            if dir_to_exit:
+                # Format: "north → locked_study, up → goal_attic"
+                dir_hints = [f"{d} → {e}" for d, e in dir_to_exit.items()]
+                return f"'{cmd['target']}' には移動できません。利用可能な方角: {', '.join(dir_hints)}", state
+
+        # Fallback: show exit names directly
+        available = ", ".join(state["available_exits"])
+        return f"'{cmd['target']}' には移動できません。移動可能: {available}", state
+
+    # Check for locked exits (Preflight check)
+    locations = state["scenario_data"].get("locations", {})
+    current_loc_data = locations.get(state["current_location"], {})
+    locked_exits = current_loc_data.get("locked_exits", {})
 
-        # Check for goal
-        is_goal = new_loc_data.get("is_goal", False)
-        result = f"📍 {target} に移動しました\n\n{format_world_state(new_state)}"
-
-        if is_goal:
-            result += "\n\n🎉 [CLEAR] ゴールに到達しました！クリアおめでとうございます！"
-
-        return result, new_state
-
-    elif cmd["action"] == "take":
-        target = cmd["target"]
-        if not target:
-            return "取る物を指定してください (例: take コーヒーメーカー)", state
-
-        # P1: BUG-002 - Check if already in inventory
-        if target in state["holding"]:
-            return f"🎒 '{target}' は既に持っています", state
-
-        if target not in state["available_objects"]:
-            available = ", ".join(state["available_objects"])
-            return f"'{target}' はここにありません。利用可能: {available}", state
-
-        # Pick up object
-        new_objects = [obj for obj in state["available_objects"] if obj != target]
-        new_holding = [*state["holding"], target]
-
-        new_state = PlayState(
-            scenario_name=state["scenario_name"],
-            current_location=state["current_location"],
-            available_objects=new_objects,
-            available_exits=state["available_exits"],
-            character_positions=state["character_positions"],
-            holding=new_holding,
-            scenario_data=state["scenario_data"],
-            unlocked_doors=state["unlocked_doors"],
-        )
+    if target in locked_exits:
+        lock_info = locked_exits[target]
+        door_name = lock_info.get("door_name", target)
 
-        return f"🎒 {target} を拾いました", new_state
-
-    elif cmd["action"] == "open":
-        target = cmd["target"]
-        if not target:
-            return "開ける対象を指定してください (例: open 引き出し)", state
-
-        # Get current location data
-        locations = state["scenario_data"].get("locations", {})
-        current_loc_data = locations.get(state["current_location"], {})
-        containers = current_loc_data.get("containers", {})
-
-        # Check if target is a valid container
-        if target not in containers:
-            # Check if it exists as an object but not a container
-            if target in state["available_objects"]:
-                return f"'{target}' は開けられません（コンテナではありません）", state
-            # List available containers
-            available_containers = list(containers.keys())
-            if available_containers:
-                return f"'{target}' は開けられません。開けられる容器: {', '.join(available_containers)}", state
-            return f"'{target}' は開けられません。この場所に開けられる容器はありません", state
-
-        # Open container and reveal contents
-        contents = containers[target]
-        new_objects = [*state["available_objects"], *contents]
-
-        new_state = PlayState(
-            scenario_name=state["scenario_name"],
-            current_location=state["current_location"],
-            available_objects=new_objects,
-            available_exits=state["available_exits"],
-            character_positions=state["character_positions"],
-            holding=state["holding"],
-            scenario_data=state["scenario_data"],
-            unlocked_doors=state["unlocked_doors"],
-        )
+        # Check if door is still locked
+        if lock_info.get("locked", False) and door_name not in state["unlocked_doors"]:
+            # Preflight: Locked door - give hints, not hard deny
+            hint = lock_info.get("hint_on_locked", "施錠されています。")
+            suggestions = lock_info.get("suggestions", ["look around"])
+            suggestions_str = " / ".join(suggestions)
+
+            return (
+                f"[PREFLIGHT] 🔒 {door_name} は施錠されています。{hint}\n"
+                f"💡 次の行動候補: {suggestions_str}"
+            ), state
+
+    # Update location
+    new_loc_data = locations.get(target, {})
 
-        contents_str = ", ".join(contents)
-        return f"📦 {target} を開けました。中には: {contents_str}", new_state
+    new_state = _replace_state(
+        state,
+        current_location=target,
+        available_objects=list(new_loc_data.get("props", [])),
+        available_exits=list(new_loc_data.get("exits", [])),
+    )
 
-    elif cmd["action"] == "search":
-        target = cmd["target"]
+    # Check for goal
+    is_goal = new_loc_data.get("is_goal", False)
+    result = f"📍 {target} に移動しました\n\n{format_world_state(new_state)}"
 
-        # Get current location data
-        locations = state["scenario_data"].get("locations", {})
-        current_loc_data = locations.get(state["current_location"], {})
-        hidden_objects = current_loc_data.get("hidden_objects", [])
-        containers = current_loc_data.get("containers", {})
+    if is_goal:
+        result += "\n\n🎉 [CLEAR] ゴールに到達しました！クリアおめでとうございます！"
+
+    return result, new_state
+
+
+def _cmd_take(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Pick up an object at the current location."""
+    holding = state["holding"]
+    available_objects = state["available_objects"]
+
+    target = cmd["target"]
+    if not target:
+        return "取る物を指定してください (例: take コーヒーメーカー)", state
+
+    # P1: BUG-002 - Check if already in inventory
+    if target in holding:
+        return f"🎒 '{target}' は既に持っています", state
+
+    if target not in available_objects:
+        available = ", ".join(available_objects)
+        return f"'{target}' はここにありません。利用可能: {available}", state
+
+    # Pick up object
+    new_objects = [obj for obj in available_objects if obj != target]
+    new_holding = [*holding, target]
+
+    new_state = _replace_state(
+        state,
+        available_objects=new_objects,
+        holding=new_holding,
+    )
+
+    return f"🎒 {target} を拾いました", new_state
+
+
+def _cmd_open(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Open a container and reveal its contents."""
+    target = cmd["target"]
+    if not target:
+        return "開ける対象を指定してください (例: open 引き出し)", state
+
+    # Get current location data
+    locations = state["scenario_data"].get("locations", {})
+    current_loc_data = locations.get(state["current_location"], {})
+    available_objects = state["available_objects"]
+    containers = current_loc_data.get("containers", {})
+
+    # Check if target is a valid container
+    if target not in containers:
+        # Check if it exists as an object but not a container
+        if target in available_objects:
+            return f"'{target}' は開けられません（コンテナではありません）", state
+        # List available containers
+        available_containers = list(containers.keys())
+        if available_containers:
+            return f"'{target}' は開けられません。開けられる容器: {', '.join(available_containers)}", state
+        return f"'{target}' は開けられません。この場所に開けられる容器はありません", state
+
+    # Open container and reveal contents
+    contents = containers[target]
+    new_objects = [*available_objects, *contents]
+
+    new_state = _replace_state(state, available_objects=new_objects)
+
+    contents_str = ", ".join(contents)
+    return f"📦 {target} を開けました。中には: {contents_str}", new_state
 
-        # P1: BUG-003 - If target is a container, suggest open command
-        if target and target in containers:
-            contents_hint = "何かが入っているようです" if containers[target] else "空のようです"
+
+def _cmd_search(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Search the location (or a target) for hidden objects."""
+    target = cmd["target"]
+
+    # Get current location data
+    locations = state["scenario_data"].get("locations", {})
+    current_loc_data = locations.get(state["current_location"], {})
+    available_objects = state["available_objects"]
+
+    # scenario_data is read-only; searched locations are tracked on the state
+    consumed = state.get("consumed_hidden_locations", [])
+    if state["current_location"] in consumed:
+        hidden_objects = []
+    else:
+        hidden_objects = current_loc_data.get("hidden_objects", [])
+    containers = current_loc_data.get("containers", {})
+
+    # P1: BUG-003 - If target is a container, suggest open command
+    if target and target in containers:
+        contents_hint = "何かが入っているようです" if containers[target] else "空のようです"
+        return (
+            f"🔍 {target} を調べました。{contents_hint}\n"
+            f"💡 ヒント: 'open {target}' で中身を確認できます"
+        ), state
+
+    # P2: BUG-006 - If target doesn't exist, try semantic matcher suggestions
+    # (containers were handled above, so only the object list is checked;
+    # the combined list is built only when the target is missing)
+    if target and target not in available_objects:
+        all_objects = [*available_objects, *containers]
+        # Try to find similar objects using basic fuzzy matching
+        suggestions = _find_similar_objects(target, all_objects)
+        if suggestions:
+            suggestion_str = ", ".join(suggestions)
             return (
-                f"🔍 {target} を調べました。{contents_hint}\n"
-                f"💡 ヒント: 'open {target}' で中身を確認できます"
+                f"🔍 '{target}' はここにありません。\n"
+                f"💡 もしかして: {suggestion_str}"
             ), state
+        return f"🔍 '{target}' はここにありません。利用可能: {', '.join(all_objects)}", state
 
-        # P2: BUG-006 - If target doesn't exist, try semantic matcher suggestions
+    if not hidden_objects:
         if target:
-            all_objects = state["available_objects"] + list(containers.keys())
-            if target not in all_objects:
-                # Try to find similar objects using basic fuzzy matching
-                suggestions = _find_similar_objects(target, all_objects)
-                if suggestions:
-                    suggestion_str = ", ".join(suggestions)
-                    return (
-                        f"🔍 '{target}' はここにありません。\n"
-                        f"💡 もしかして: {suggestion_str}"
-                    ), state
-                return f"🔍 '{target}' はここにありません。利用可能: {', '.join(all_objects)}", state
-
-        if not hidden_objects:
-            if target:
-                return f"🔍 {target} を調べましたが、何も見つかりませんでした", state
-            return f"🔍 {state['current_location']} を調べましたが、何も見つかりませんでした", state
-
-        # Reveal hidden objects
-        new_objects = [*state["available_objects"], *hidden_objects]
-
-        # Remove hidden objects from scenario data to prevent re-discovery
-        new_scenario_data = state["scenario_data"].copy()
-        new_locations = new_scenario_data.get("locations", {}).copy()
-        new_loc_data = new_locations.get(state["current_location"], {}).copy()
-        new_loc_data["hidden_objects"] = []
-        new_locations[state["current_location"]] = new_loc_data
-        new_scenario_data["locations"] = new_locations
-
-        new_state = PlayState(
-            scenario_name=state["scenario_name"],
-            current_location=state["current_location"],
-            available_objects=new_objects,
-            available_exits=state["available_exits"],
-            character_positions=state["character_positions"],
-            holding=state["holding"],
-            scenario_data=new_scenario_data,
-            unlocked_doors=state["unlocked_doors"],
-        )
+            return f"🔍 {target} を調べましたが、何も見つかりませんでした", state
+        return f"🔍 {state['current_location']} を調べましたが、何も見つかりませんでした", state
 
-        found_str = ", ".join(hidden_objects)
-        if target:
-            return f"🔍 {target} を調べると、{found_str} を発見しました！", new_state
-        return f"🔍 {state['current_location']} を調べると、{found_str} を発見しました！", new_state
-
-    elif cmd["action"] == "where":
-        lines = [
-            f"📍 現在地: {state['current_location']}",
-            "",
-            "👥 キャラクター位置:",
-        ]
-        for name, location in state["character_positions"].items():
-            marker = " ← あなた" if location == state["current_location"] else ""
-            lines.append(f"  - {name}: {location}{marker}")
-        return "\n".join(lines), state
-
-    elif cmd["action"] == "inventory":
-        if not state["holding"]:
-            return "🎒 所持品: 何も持っていません", state
-        items_str = ", ".join(state["holding"])
-        return f"🎒 所持品 ({len(state['holding'])}個): {items_str}", state
-
-    elif cmd["action"] == "map":
-        locations = state["scenario_data"].get("locations", {})
-        if not locations:
-            return "🗺️ マップ情報がありません", state
-
-        lines = ["🗺️ マップ:"]
-        for loc_name, loc_data in locations.items():
-            marker = "📍" if loc_name == state["current_location"] else "  "
-            exits = loc_data.get("exits", [])
-            exits_str = ", ".join(exits) if exits else "(行き止まり)"
-            lines.append(f"{marker} {loc_name} → {exits_str}")
-        return "\n".join(lines), state
-
-    elif cmd["action"] == "use":
-        target = cmd["target"]
-        if not target:
-            return "使用するアイテムとドアを指定してください (例: use iron_key north_door)", state
-
-        # Parse "key door" format
-        parts = target.split()
-        if len(parts) < 2:
-            return "使用するアイテムとドアを指定してください (例: use iron_key north_door)", state
-
-        key_item = parts[0]
-        door_or_exit = parts[1]
-
-        # Check if player has the key
-        if key_item not in state["holding"]:
-            return f"🎒 '{key_item}' を持っていません。(所持品: {', '.join(state['holding']) or 'なし'})", state
-
-        # Find locked exit that matches the door
-        locations = state["scenario_data"].get("locations", {})
-        current_loc_data = locations.get(state["current_location"], {})
-        locked_exits = current_loc_data.get("locked_exits", {})
-
-        # P1: BUG-004 - Accept both exit_name and door_name
-        # First try to match by door_name
-        target_exit = None
-        lock_info = None
-        door_name = None
+    # Reveal hidden objects
+    new_objects = [*available_objects, *hidden_objects]
+
+    # Mark the location searched to prevent re-discovery
+    new_state = _replace_state(
+        state,
+        available_objects=new_objects,
+        consumed_hidden_locations=[*consumed, state["current_location"]],
+    )
+
+    found_str = ", ".join(hidden_objects)
+    if target:
+        return f"🔍 {target} を調べると、{found_str} を発見しました！", new_state
+    return f"🔍 {state['current_location']} を調べると、{found_str} を発見しました！", new_state
+
+
+def _cmd_where(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Show the current location and character positions."""
+    lines = [
+        f"📍 現在地: {state['current_location']}",
+        "",
+        "👥 キャラクター位置:",
+    ]
+    for name, location in state["character_positions"].items():
+        marker = " ← あなた" if location == state["current_location"] else ""
+        lines.append(f"  - {name}: {location}{marker}")
+    return "\n".join(lines), state
+
+
+def _cmd_inventory(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Show held items."""
+    holding = state["holding"]
+
+    if not holding:
+        return "🎒 所持品: 何も持っていません", state
+    items_str = ", ".join(holding)
+    return f"🎒 所持品 ({len(holding)}個): {items_str}", state
+
+
+def _cmd_map(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Show all locations and their exits."""
+    locations = state["scenario_data"].get("locations", {})
 
+    if not locations:
+        return "🗺️ マップ情報がありません", state
+
+    lines = ["🗺️ マップ:"]
+    for loc_name, loc_data in locations.items():
+        marker = "📍" if loc_name == state["current_location"] else "  "
+        exits = loc_data.get("exits", [])
+        exits_str = ", ".join(exits) if exits else "(行き止まり)"
+        lines.append(f"{marker} {loc_name} → {exits_str}")
+    return "\n".join(lines), state
+
+
+def _cmd_use(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Use a held key on a locked door."""
+    holding = state["holding"]
+
+    target = cmd["target"]
+    if not target:
+        return "使用するアイテムとドアを指定してください (例: use iron_key north_door)", state
+
+    # Parse "key door" format (words after the door are ignored, so stop
+    # splitting after the second word)
+    parts = target.split(maxsplit=2)
+    if len(parts) < 2:
+        return "使用するアイテムとドアを指定してください (例: use iron_key north_door)", state
+
+    key_item = parts[0]
+    door_or_exit = parts[1]
+
+    # Check if player has the key
+    if key_item not in holding:
+        return f"🎒 '{key_item}' を持っていません。(所持品: {', '.join(holding) or 'なし'})", state
+
+    # Find locked exit that matches the door
+    locations = state["scenario_data"].get("locations", {})
+    current_loc_data = locations.get(state["current_location"], {})
+    locked_exits = current_loc_data.get("locked_exits", {})
+
+    # P1: BUG-004 - Accept both exit_name and door_name
+    # First try to match by door_name
+    target_exit = _door_name_index(locked_exits).get(door_or_exit)
+    lock_info = None
+    door_name = None
+
+    if target_exit is not None:
+        lock_info = locked_exits[target_exit]
+        door_name = door_or_exit
+
+    # If no match by door_name, try by exit_name
+    elif door_or_exit in locked_exits:
+        target_exit = door_or_exit
+        lock_info = locked_exits[door_or_exit]
+        door_name = lock_info.get("door_name", door_or_exit)
+
+    if not lock_info:
+        # Show available doors with their exit mappings
+        available_doors = []
         for exit_name, info in locked_exits.items():
-            if info.get("door_name") == door_or_exit:
-                target_exit = exit_name
-                lock_info = info
-                door_name = door_or_exit
-                break
-
-        # If no match by door_name, try by exit_name
-        if not lock_info and door_or_exit in locked_exits:
-            target_exit = door_or_exit
-            lock_info = locked_exits[door_or_exit]
-            door_name = lock_info.get("door_name", door_or_exit)
-
-        if not lock_info:
-            # Show available doors with their exit mappings
-            available_doors = []
-            for exit_name, info in locked_exits.items():
-                d_name = info.get("door_name", exit_name)
-                available_doors.append(f"{d_name} ({exit_name})")
-            if available_doors:
-                return f"🚪 '{door_or_exit}' という施錠されたドアは見当たりません。\n💡 利用可能: {', '.join(available_doors)}", state
-            return f"🚪 '{door_or_exit}' という施錠されたドアは見当たりません", state
-
-        # Check if key matches
-        required_key = lock_info.get("required_key")
-        if key_item != required_key:
-            return f"🔑 '{key_item}' では '{door_name}' を開けられません", state
-
-        # Unlock the door
-        new_unlocked = [*state["unlocked_doors"], door_name]
-
-        new_state = PlayState(
-            scenario_name=state["scenario_name"],
-            current_location=state["current_location"],
-            available_objects=state["available_objects"],
-            available_exits=state["available_exits"],
-            character_positions=state["character_positions"],
-            holding=state["holding"],
-            scenario_data=state["scenario_data"],
-            unlocked_doors=new_unlocked,
-        )
+            d_name = info.get("door_name", exit_name)
+            available_doors.append(f"{d_name} ({exit_name})")
+        if available_doors:
+            return f"🚪 '{door_or_exit}' という施錠されたドアは見当たりません。\n💡 利用可能: {', '.join(available_doors)}", state
+        return f"🚪 '{door_or_exit}' という施錠されたドアは見当たりません", state
+
+    # Check if key matches
+    required_key = lock_info.get("required_key")
+    if key_item != required_key:
+        return f"🔑 '{key_item}' では '{door_name}' を開けられません", state
+
+    # Unlock the door
+    new_unlocked = [*state["unlocked_doors"], door_name]
+
+    new_state = _replace_state(state, unlocked_doors=new_unlocked)
+
+    return f"🔓 {key_item} で {door_name} を解錠しました！{target_exit} への道が開けました", new_state
+
+
+def _cmd_quit(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Quit play mode."""
+    return "終了します。", state
+
+
+def _cmd_unknown(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Report an unknown command with a suggestion."""
+    msg = f"❓ 不明なコマンド: {cmd.get('target', '')}"
+    suggestion = suggest_command(cmd.get("target", ""))
+    if suggestion:
+        msg += f"\n💡 {suggestion}"
+    msg += "\n📖 'help' でコマンド一覧を表示"
+    return msg, state
+
+
+# Command handlers, keyed by ParsedCommand action
+_COMMAND_HANDLERS: dict[str, Callable[[ParsedCommand, PlayState], tuple[str, PlayState]]] = {
+    "look": _cmd_look,
+    "status": _cmd_status,
+    "help": _cmd_help,
+    "save": _cmd_save,
+    "load": _cmd_load,
+    "move": _cmd_move,
+    "take": _cmd_take,
+    "open": _cmd_open,
+    "search": _cmd_search,
+    "where": _cmd_where,
+    "inventory": _cmd_inventory,
+    "map": _cmd_map,
+    "use": _cmd_use,
+    "quit": _cmd_quit,
+}
 
-        return f"🔓 {key_item} で {door_name} を解錠しました！{target_exit} への道が開けました", new_state
 
-    elif cmd["action"] == "quit":
-        return "終了します。", state
+def execute_command(cmd: ParsedCommand, state: PlayState) -> tuple[str, PlayState]:
+    """Execute a parsed command and return result.
 
-    else:
-        msg = f"❓ 不明なコマンド: {cmd.get('target', '')}"
-        suggestion = suggest_command(cmd.get("target", ""))
-        if suggestion:
-            msg += f"\n💡 {suggestion}"
-        msg += "\n📖 'help' でコマンド一覧を表示"
-        return msg, state
+    Args:
+        cmd: Parsed command
+        state: Current play state
+
+    Returns:
+        Tuple of (output message, updated state)
+    """
+    handler = _COMMAND_HANDLERS.get(cmd["action"], _cmd_unknown)
+    return handler(cmd, state)
 
 
 # =============================================================================
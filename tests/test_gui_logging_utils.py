@@ -0,0 +1,53 @@
+"""Tests for GUI logging utilities (TraceContext / LogBuffer)."""
+
+from gui_nicegui.utils.logging_utils import LogBuffer
+
+
+class TestLogBuffer:
+    """Tests for LogBuffer."""
+
+    def test_get_all_joins_lines(self):
+        """get_all should return lines joined by newline."""
+        buffer = LogBuffer()
+        buffer.append("a")
+        buffer.append("b")
+
+        assert buffer.get_all() == "a\nb"
+
+    def test_get_all_reflects_append_after_read(self):
+        """Cached output must be invalidated on append."""
+        buffer = LogBuffer()
+        buffer.append("a")
+        assert buffer.get_all() == "a"
+
+        buffer.append("b")
+
+        assert buffer.get_all() == "a\nb"
+
+    def test_get_all_reflects_clear(self):
+        """Cached output must be invalidated on clear."""
+        buffer = LogBuffer()
+        buffer.append("a")
+        assert buffer.get_all() == "a"
+
+        buffer.clear()
+
+        assert buffer.get_all() == ""
+
+    def test_max_lines_trims_oldest(self):
+        """Only the newest max_lines lines should be kept."""
+        buffer = LogBuffer(max_lines=2)
+        for line in ["a", "b", "c"]:
+            buffer.append(line)
+
+        assert buffer.get_all() == "b\nc"
+        assert buffer.get_last(1) == "c"
+
+    def test_callback_receives_line(self):
+        """Callback should be called with each appended line."""
+        received: list[str] = []
+        buffer = LogBuffer(callback=received.append)
+
+        buffer.append("hello")
+
+        assert received == ["hello"]
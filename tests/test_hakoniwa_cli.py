@@ -179,3 +179,24 @@ class TestValidatePlayStateHashMismatchDetail:
         assert errors == []
         assert data is not None
         assert data["schema_version"] == "1.0.0"
+
+    def test_valid_file_passes_without_orjson(self, tmp_path, monkeypatch):
+        """Stdlib json fallback should produce the same result."""
+        monkeypatch.setattr("hakoniwa.cli.ORJSON_AVAILABLE", False)
+        state_file = tmp_path / "valid.json"
+        hash_file = tmp_path / "valid.json.sha256"
+
+        content = json.dumps({
+            "schema_version": "1.0.0",
+            "scenario_name": "テスト",
+            "current_location": "start",
+            "holding": ["鍵"],
+        }, ensure_ascii=False)
+        state_file.write_text(content, encoding="utf-8")
+        hash_file.write_text(compute_hash(content), encoding="utf-8")
+
+        is_valid, errors, data = _validate_play_state(state_file)
+
+        assert is_valid is True
+        assert data["scenario_name"] == "テスト"
+        assert data["holding"] == ["鍵"]
@@ -0,0 +1,78 @@
+"""Tests for hakoniwa config loading and validation."""
+
+from hakoniwa.config import HakoniwaConfig, load_config, validate_config
+
+
+class TestValidateConfig:
+    """Tests for validate_config function."""
+
+    def test_valid_config_returns_loaded_model(self, tmp_path):
+        """Valid config should return the parsed HakoniwaConfig."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("llm_model: test-model\nmax_turns: 5\n", encoding="utf-8")
+
+        is_valid, errors, config = validate_config(config_path)
+
+        assert is_valid
+        assert errors == []
+        assert isinstance(config, HakoniwaConfig)
+        assert config.llm_model == "test-model"
+        assert config.max_turns == 5
+
+    def test_empty_config_returns_defaults(self, tmp_path):
+        """Empty config file should validate to default values."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("", encoding="utf-8")
+
+        is_valid, errors, config = validate_config(config_path)
+
+        assert is_valid
+        assert config == HakoniwaConfig()
+
+    def test_missing_file_returns_error(self, tmp_path):
+        """Missing config file should be reported without a model."""
+        is_valid, errors, config = validate_config(tmp_path / "missing.yaml")
+
+        assert not is_valid
+        assert "not found" in errors[0]
+        assert config is None
+
+    def test_invalid_yaml_returns_error(self, tmp_path):
+        """Broken YAML should be reported as Invalid YAML."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("llm_model: [unclosed\n", encoding="utf-8")
+
+        is_valid, errors, config = validate_config(config_path)
+
+        assert not is_valid
+        assert "Invalid YAML" in errors[0]
+        assert config is None
+
+    def test_unknown_field_returns_error(self, tmp_path):
+        """Unknown fields are rejected (extra=forbid)."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("unknown_field: 1\n", encoding="utf-8")
+
+        is_valid, errors, config = validate_config(config_path)
+
+        assert not is_valid
+        assert config is None
+
+
+class TestLoadConfig:
+    """Tests for load_config function."""
+
+    def test_none_returns_defaults(self):
+        """No path should return default config."""
+        assert load_config(None) == HakoniwaConfig()
+
+    def test_missing_file_returns_defaults(self, tmp_path):
+        """Missing file should return default config."""
+        assert load_config(tmp_path / "missing.yaml") == HakoniwaConfig()
+
+    def test_utf8_content_is_loaded(self, tmp_path):
+        """Non-ASCII values should survive loading from bytes."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text('llm_model: "テスト"\n', encoding="utf-8")
+
+        assert load_config(config_path).llm_model == "テスト"
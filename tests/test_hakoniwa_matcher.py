@@ -21,6 +21,7 @@ from hakoniwa.logic.matcher import (
     # Matchers
     FuzzyMatcher,
     is_rapidfuzz_available,
+    prepare_world_objects,
     # Preprocessor
     expand_queries,
     extract_x_no_y_pattern,
@@ -121,6 +122,16 @@ class TestFuzzyMatcher:
         assert result.candidates[0].score == 1.0
 
 
+    def test_prepared_world_matches_like_set(self):
+        matcher = FuzzyMatcher(suggest_threshold=0.6)
+        world = {"冷蔵庫", "テレビ"}
+        prepared = prepare_world_objects(world)
+
+        assert prepare_world_objects(world) is prepared  # cached per world
+        assert matcher.match("冷蔵庫", prepared) == matcher.match("冷蔵庫", world)
+        assert matcher.match("冷蔵こ", prepared) == matcher.match("冷蔵こ", world)
+
+
 class TestGenericNouns:
     """Guardrail: Generic nouns should not be auto-adopted."""
 
@@ -234,6 +245,30 @@ class TestAuditLog:
         assert len(logger.entries) == 1
         assert logger.entries[0].input_query == "test"
 
+    def test_to_dict_sorts_world_objects(self):
+        result = MatchResult(
+            query="test",
+            candidates=[MatchCandidate(name="b", score=0.8)],
+        )
+        world = {"c", "a", "b"}
+
+        entry = AuditLogEntry.from_match_result(result, world)
+        world.add("z")  # Later mutation must not leak into the entry
+
+        assert entry.to_dict()["world_objects"] == ["a", "b", "c"]
+
+    def test_presorted_tuple_is_kept(self):
+        result = MatchResult(
+            query="test",
+            candidates=[MatchCandidate(name="b", score=0.8)],
+        )
+        world = ("a", "b", "c")
+
+        entry = AuditLogEntry.from_match_result(result, world)
+
+        assert entry.world_objects is world
+        assert entry.to_dict()["world_objects"] == ["a", "b", "c"]
+
     def test_file_logger(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             log_path = Path(tmpdir) / "audit.jsonl"
@@ -267,6 +302,11 @@ class TestSuggestMatch:
         assert result[0] == "テレビ"
         assert result[1] == 1.0
 
+    def test_exact_match_wins_over_expansion(self):
+        # "冷蔵庫の牛乳" exists as-is; it must not be expanded to "冷蔵庫"
+        result = suggest_match("冷蔵庫の牛乳", world_objects={"冷蔵庫", "冷蔵庫の牛乳"})
+        assert result == ("冷蔵庫の牛乳", 1.0)
+
     def test_x_no_y_pattern(self):
         result = suggest_match("冷蔵庫の牛乳", world_objects={"冷蔵庫", "牛乳"})
         assert result is not None
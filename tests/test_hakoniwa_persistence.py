@@ -0,0 +1,222 @@
+"""Tests for hakoniwa persistence (save/load) helpers."""
+
+import os
+import pickle
+
+import pytest
+
+from hakoniwa.dto.manifest import Manifest
+from hakoniwa.dto.world_state import TurnRecord, WorldStateDTO
+from hakoniwa.persistence import (
+    load_dry_run,
+    load_world_state,
+    restore_world_state,
+    save_world_state,
+    snapshot_world_state,
+    try_load_world_state,
+)
+from hakoniwa.persistence.load import _is_compatible_version
+
+
+@pytest.fixture
+def world_state() -> WorldStateDTO:
+    """Create a small WorldStateDTO."""
+    return WorldStateDTO(
+        manifest=Manifest(description="unit test"),
+        scenario_id="test_scenario",
+        history=[
+            TurnRecord(turn_index=0, speaker="やな", response="こんにちは"),
+            TurnRecord(turn_index=1, speaker="あゆ", response="姉様、こんにちは。"),
+        ],
+    )
+
+
+class TestTryLoadWorldState:
+    """Tests for try_load_world_state function."""
+
+    def test_valid_file_returns_state(self, tmp_path, world_state):
+        """Valid save should return the state and no errors."""
+        path = tmp_path / "state.json"
+        save_world_state(world_state, path)
+
+        state, errors = try_load_world_state(path)
+
+        assert errors == []
+        assert state == world_state
+
+    def test_missing_file_returns_errors(self, tmp_path):
+        """Missing file should return None with the dry-run error."""
+        state, errors = try_load_world_state(tmp_path / "missing.json")
+
+        assert state is None
+        assert "File not found" in errors[0]
+
+    def test_tampered_file_returns_hash_error(self, tmp_path, world_state):
+        """Edited file should fail hash verification."""
+        path = tmp_path / "state.json"
+        save_world_state(world_state, path)
+        path.write_text(path.read_text(encoding="utf-8") + " ", encoding="utf-8")
+
+        state, errors = try_load_world_state(path)
+
+        assert state is None
+        assert "Hash mismatch" in errors[0]
+
+    def test_matches_dry_run_and_load(self, tmp_path, world_state):
+        """Result should agree with load_dry_run + load_world_state."""
+        path = tmp_path / "state.json"
+        save_world_state(world_state, path)
+
+        state, _ = try_load_world_state(path)
+
+        assert load_dry_run(path) == (True, [])
+        assert load_world_state(path) == state
+
+
+class TestIntegrityAlgorithm:
+    """Tests for save_world_state(algorithm=...) sidecar selection."""
+
+    def test_default_writes_sha256_sidecar(self, tmp_path, world_state):
+        """The default algorithm should write a .sha256 sidecar."""
+        path = tmp_path / "state.json"
+
+        save_world_state(world_state, path)
+
+        assert (tmp_path / "state.json.sha256").exists()
+        assert not (tmp_path / "state.json.blake2b").exists()
+
+    def test_blake2b_round_trip(self, tmp_path, world_state):
+        """blake2b saves should write .blake2b and load back."""
+        path = tmp_path / "state.json"
+
+        content_hash = save_world_state(world_state, path, algorithm="blake2b")
+
+        assert (tmp_path / "state.json.blake2b").read_text(encoding="utf-8") == content_hash
+        assert not (tmp_path / "state.json.sha256").exists()
+        assert load_world_state(path) == world_state
+
+    def test_switching_algorithm_removes_stale_sidecar(self, tmp_path, world_state):
+        """Re-saving with another algorithm should drop the old sidecar."""
+        path = tmp_path / "state.json"
+        save_world_state(world_state, path)
+
+        save_world_state(world_state, path, algorithm="blake2b")
+
+        assert not (tmp_path / "state.json.sha256").exists()
+        assert load_dry_run(path) == (True, [])
+
+    def test_algorithm_does_not_change_saved_content(self, tmp_path, world_state):
+        """The algorithm only picks the sidecar; the state bytes are identical."""
+        sha_path = tmp_path / "sha.json"
+        blake_path = tmp_path / "blake.json"
+
+        save_world_state(world_state, sha_path)
+        save_world_state(world_state, blake_path, algorithm="blake2b")
+
+        assert sha_path.read_bytes() == blake_path.read_bytes()
+
+    def test_unchanged_save_removes_stale_sidecar(self, tmp_path, world_state):
+        """A skipped rewrite should still drop sidecars of other algorithms."""
+        path = tmp_path / "state.json"
+        save_world_state(world_state, path, algorithm="blake2b")
+        (tmp_path / "state.json.sha256").write_text("0" * 64, encoding="utf-8")
+
+        save_world_state(world_state, path, algorithm="blake2b")
+
+        assert not (tmp_path / "state.json.sha256").exists()
+
+    def test_stale_sha256_does_not_mask_valid_blake2b(self, tmp_path, world_state):
+        """Load should accept the file when any existing sidecar matches."""
+        path = tmp_path / "state.json"
+        save_world_state(world_state, path, algorithm="blake2b")
+        (tmp_path / "state.json.sha256").write_text("0" * 64, encoding="utf-8")
+
+        assert load_world_state(path) == world_state
+
+    def test_missing_sidecar_lists_both_suffixes(self, tmp_path, world_state):
+        """The error should name every accepted sidecar suffix."""
+        path = tmp_path / "state.json"
+        save_world_state(world_state, path)
+        (tmp_path / "state.json.sha256").unlink()
+
+        state, errors = try_load_world_state(path)
+
+        assert state is None
+        assert "state.json.sha256" in errors[0]
+        assert "state.json.blake2b" in errors[0]
+
+
+class TestSaveWorldState:
+    """Tests for save_world_state write behavior."""
+
+    def test_unchanged_state_is_not_rewritten(self, tmp_path, world_state):
+        """Saving identical content twice should leave the file untouched."""
+        path = tmp_path / "state.json"
+        save_world_state(world_state, path)
+        os.utime(path, ns=(0, 0))  # Any rewrite would bump this
+
+        save_world_state(world_state, path)
+
+        assert path.stat().st_mtime_ns == 0
+
+    def test_changed_state_is_rewritten(self, tmp_path, world_state):
+        """Changed content should be written and verify on load."""
+        path = tmp_path / "state.json"
+        save_world_state(world_state, path)
+
+        world_state.scenario_id = "changed"
+        save_world_state(world_state, path)
+
+        assert load_world_state(path).scenario_id == "changed"
+
+    def test_no_temp_files_left_behind(self, tmp_path, world_state):
+        """Atomic writes should not leave .tmp files."""
+        path = tmp_path / "state.json"
+
+        save_world_state(world_state, path)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["state.json", "state.json.sha256"]
+
+
+class TestSnapshotWorldState:
+    """Tests for in-process snapshot/restore."""
+
+    def test_round_trip(self, world_state):
+        """Restored state should equal the original."""
+        restored = restore_world_state(snapshot_world_state(world_state))
+
+        assert restored == world_state
+        assert restored is not world_state
+
+    def test_snapshot_is_independent(self, world_state):
+        """Changes after the snapshot must not leak into the restored state."""
+        snapshot = snapshot_world_state(world_state)
+        world_state.history.append(TurnRecord(turn_index=2, speaker="やな", response="追加"))
+
+        assert len(restore_world_state(snapshot).history) == 2
+
+    def test_rejects_non_world_state(self):
+        """Snapshots of other objects should be rejected."""
+        with pytest.raises(TypeError):
+            restore_world_state(pickle.dumps({"scenario_id": "x"}, protocol=5))
+
+
+class TestIsCompatibleVersion:
+    """Tests for schema version compatibility check."""
+
+    @pytest.mark.parametrize(
+        "file_version,expected",
+        [
+            ("1.0.0", True),
+            ("1.2.3", True),
+            ("1", True),
+            ("2.0.0", False),
+            ("unknown", False),
+            ("", False),
+            (1, False),
+            (None, False),
+        ],
+    )
+    def test_major_version_check(self, file_version, expected):
+        """Only the major component is compared."""
+        assert _is_compatible_version(file_version, "1.0.0") is expected
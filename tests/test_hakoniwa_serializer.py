@@ -0,0 +1,207 @@
+"""Tests for hakoniwa canonical serialization."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from hakoniwa.dto.manifest import Manifest
+from hakoniwa.dto.world_state import ArtifactReference, TurnRecord, WorldStateDTO
+from hakoniwa.serializer import canonical
+from hakoniwa.serializer.canonical import (
+    deserialize_from_json,
+    serialize_to_bytes,
+    serialize_to_json,
+)
+
+
+@pytest.fixture
+def world_state() -> WorldStateDTO:
+    """Create a WorldStateDTO with nested models and non-ASCII text."""
+    return WorldStateDTO(
+        manifest=Manifest(description="シリアライズテスト"),
+        scenario_id="test_scenario",
+        history=[
+            TurnRecord(
+                turn_index=0,
+                speaker="やな",
+                response="わあ、すごい！",
+                thought="(ドキドキ)",
+                evaluation_score=0.75,
+            ),
+            TurnRecord(turn_index=1, speaker="あゆ", response="姉様、落ち着いて。"),
+        ],
+        artifacts=[
+            ArtifactReference(turn_index=0, artifact_type="raw_response", relative_path="turn_0.log"),
+        ],
+    )
+
+
+class TestSerializeToJson:
+    """Tests for serialize_to_json function."""
+
+    def test_keys_are_sorted_recursively(self, world_state):
+        """Output should have sorted keys at every level."""
+        content = serialize_to_json(world_state)
+
+        assert content == json.dumps(
+            json.loads(content), ensure_ascii=False, indent=2, sort_keys=True
+        ) + "\n"
+
+    def test_trailing_newline_and_utf8(self, world_state):
+        """Output ends with newline and keeps non-ASCII characters."""
+        content = serialize_to_json(world_state)
+
+        assert content.endswith("}\n")
+        assert "やな" in content
+        assert "\\u" not in content
+
+    def test_orjson_and_stdlib_paths_match(self, world_state, monkeypatch):
+        """orjson fast path must produce byte-identical canonical output."""
+        if not canonical.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        fast = serialize_to_json(world_state)
+
+        monkeypatch.setattr(canonical, "ORJSON_AVAILABLE", False)
+        slow = serialize_to_json(world_state)
+
+        assert fast == slow
+
+    def test_round_trip(self, world_state):
+        """Deserializing serialized output should give an equal DTO."""
+        content = serialize_to_json(world_state)
+
+        assert deserialize_from_json(content, WorldStateDTO) == world_state
+
+
+class TestHistoryCanonicalCache:
+    """Tests for cached per-turn canonical dumps."""
+
+    def test_canonical_data_matches_model_dump(self, world_state):
+        """canonical_data should equal model_dump(mode='json')."""
+        assert world_state.canonical_data() == world_state.model_dump(mode="json")
+
+    def test_mutating_canonical_data_keeps_cache(self, world_state):
+        """Changing the returned dicts must not leak into later serializations."""
+        expected = serialize_to_bytes(world_state)
+
+        data = world_state.canonical_data()
+        data["history"][0]["response"] = "変更後"
+
+        assert serialize_to_bytes(world_state) == expected
+
+    def test_field_write_is_rejected(self, world_state):
+        """Turns are frozen, so a cached dump can never go stale."""
+        serialize_to_json(world_state)
+
+        with pytest.raises(ValidationError):
+            world_state.history[0].response = "変更後"
+
+        assert "変更後" not in serialize_to_json(world_state)
+
+    def test_model_copy_update_invalidates_cache(self, world_state):
+        """Updated copies must not reuse the original turn's cache."""
+        serialize_to_json(world_state)
+        turn = world_state.history[0].model_copy(update={"response": "コピー"})
+
+        assert turn.model_dump(mode="json")["response"] == "コピー"
+        assert turn._canonical_dict()["response"] == "コピー"
+
+    def test_cache_does_not_affect_equality(self, world_state):
+        """Cached and uncached turns with same fields compare equal."""
+        fresh = world_state.model_copy(deep=True)
+        serialize_to_json(world_state)
+
+        assert world_state.history[0] == fresh.history[0]
+        assert hash(world_state.history[0]) == hash(fresh.history[0])
+
+    def test_artifact_references_deduplicate(self):
+        """Identical artifact references should collapse in a set."""
+        refs = [
+            ArtifactReference(turn_index=0, artifact_type="raw_response", relative_path="turn_0.log"),
+            ArtifactReference(turn_index=0, artifact_type="raw_response", relative_path="turn_0.log"),
+        ]
+
+        assert len(set(refs)) == 1
+
+    @pytest.mark.parametrize(
+        "created_at",
+        [
+            datetime(2026, 1, 1, 12, 0, 0),
+            datetime(2026, 1, 1, 12, 0, 0, 120000),
+            datetime(2026, 1, 1, tzinfo=timezone.utc),
+            datetime(2026, 1, 1, 1, 2, 3, 5, tzinfo=timezone(timedelta(hours=9))),
+        ],
+    )
+    def test_turn_dict_matches_pydantic_json_mode(self, created_at):
+        """Direct field dump must match model_dump(mode='json')."""
+        turn = TurnRecord(
+            turn_index=3,
+            speaker="やな",
+            response="テスト",
+            evaluation_score=1,
+            created_at=created_at,
+        )
+
+        assert turn._canonical_dict() == turn.model_dump(mode="json")
+
+
+class TestSerializeToBytes:
+    """Tests for serialize_to_bytes function."""
+
+    def test_matches_encoded_string(self, world_state):
+        """Bytes output should equal the UTF-8 encoded string output."""
+        assert serialize_to_bytes(world_state) == serialize_to_json(world_state).encode("utf-8")
+
+    def test_stdlib_fallback_matches(self, world_state, monkeypatch):
+        """Fallback path should produce the same bytes."""
+        expected = serialize_to_bytes(world_state)
+
+        monkeypatch.setattr(canonical, "ORJSON_AVAILABLE", False)
+
+        assert serialize_to_bytes(world_state) == expected
+
+    def test_typical_history_takes_orjson_fast_path(self, world_state, monkeypatch):
+        """Warm saves should only call orjson.dumps once, for the document."""
+        if not canonical.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        turns = [
+            TurnRecord(turn_index=i, speaker="やな", response="はい", evaluation_score=i / 200)
+            for i in range(200)
+        ]
+        state = world_state.model_copy(update={"history": turns})
+        expected = serialize_to_bytes(state)
+
+        calls = []
+        real_dumps = canonical.orjson.dumps
+
+        def counting_dumps(*args, **kwargs):
+            calls.append(args[0])
+            return real_dumps(*args, **kwargs)
+
+        def no_stdlib(data):
+            raise AssertionError("stdlib fallback used")
+
+        monkeypatch.setattr(canonical.orjson, "dumps", counting_dumps)
+        monkeypatch.setattr(canonical, "_stdlib_dumps", no_stdlib)
+
+        assert serialize_to_bytes(state) == expected
+        # Per-turn float checks are cached; only the small config/manifest
+        # sections are checked again
+        assert sum(isinstance(arg, float) for arg in calls) <= 1
+        assert sum(isinstance(arg, dict) for arg in calls) == 1
+
+    @pytest.mark.parametrize("score", [1e-05, 1e-7])
+    def test_small_floats_match_stdlib(self, world_state, monkeypatch, score):
+        """Floats orjson would write differently (0.00001, 1e-7) use stdlib formatting."""
+        turn = world_state.history[0].model_copy(update={"evaluation_score": score})
+        state = world_state.model_copy(update={"history": [turn]})
+        expected_json = serialize_to_json(state)
+        expected_bytes = serialize_to_bytes(state)
+
+        monkeypatch.setattr(canonical, "ORJSON_AVAILABLE", False)
+
+        assert serialize_to_json(state) == expected_json
+        assert serialize_to_bytes(state) == expected_bytes
+        assert f'"evaluation_score": {score!r}' in expected_json
@@ -44,6 +44,27 @@ class TestPlayModeLoader:
         assert "コーヒーメーカー" in state["available_objects"]
         assert "リビング" in state["available_exits"]
 
+    def test_reload_picks_up_file_changes(self, tmp_path):
+        """Cached scenario should be re-read after the file changes."""
+        import os
+
+        from scripts.play_mode import load_scenario_for_play
+
+        path = tmp_path / "scenario.json"
+        scenario = {
+            "name": "before",
+            "locations": {"キッチン": {"props": [], "exits": []}},
+            "characters": {"やな": {"location": "キッチン"}},
+        }
+        path.write_text(json.dumps(scenario, ensure_ascii=False), encoding="utf-8")
+        assert load_scenario_for_play(path)["scenario_name"] == "before"
+
+        scenario["name"] = "after!"
+        path.write_text(json.dumps(scenario, ensure_ascii=False), encoding="utf-8")
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+
+        assert load_scenario_for_play(path)["scenario_name"] == "after!"
+
     def test_scenario_not_found_raises_error(self, tmp_path):
         """Should raise FileNotFoundError for missing scenario."""
         from scripts.play_mode import load_scenario_for_play
@@ -1106,6 +1127,228 @@ class TestSaveLoadCommand:
         assert loaded_state["current_location"] == "start_hall"
         assert "north_door" in loaded_state["unlocked_doors"]
 
+    def test_save_without_orjson_writes_same_format(self, tmp_path, monkeypatch):
+        """Stdlib json fallback should produce byte-identical canonical JSON."""
+        import hashlib
+
+        from scripts import play_mode
+        from scripts.play_mode import _json_dumps_canonical, save_play_state
+
+        data = {"b": ["鍵"], "a": {"z": 1, "y": []}, "c": None}
+        fast = _json_dumps_canonical(data)
+        monkeypatch.setattr(play_mode, "ORJSON_AVAILABLE", False)
+
+        assert _json_dumps_canonical(data) == fast
+
+        state = play_mode.PlayState(
+            scenario_name="テスト",
+            current_location="start_hall",
+            available_objects=[],
+            available_exits=[],
+            character_positions={},
+            holding=["鍵"],
+            scenario_data={},
+            unlocked_doors=[],
+        )
+        path = save_play_state(state, tmp_path / "state.json")
+        content = path.read_bytes()
+        assert content.endswith(b"\n")
+        assert (tmp_path / "state.json.sha256").read_text() == hashlib.sha256(content).hexdigest()
+
+    def test_save_references_scenario_file(self, tmp_path):
+        """Saves of a loaded scenario store a reference plus changed locations."""
+        from scripts.play_mode import (
+            execute_command,
+            load_play_state,
+            load_scenario_for_play,
+            save_play_state,
+        )
+
+        scenario_path = tmp_path / "scenario.json"
+        scenario_path.write_text(
+            json.dumps(
+                {
+                    "name": "ref_test",
+                    "locations": {
+                        "hall": {"props": ["rug"], "exits": ["study"], "hidden_objects": ["key"]},
+                        "study": {"props": ["desk"], "exits": ["hall"]},
+                    },
+                    "characters": {"やな": {"location": "hall"}},
+                },
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        state = load_scenario_for_play(scenario_path)
+        _, state = execute_command({"action": "search", "target": None}, state)
+
+        save_path = save_play_state(state, tmp_path / "state.json")
+        saved = json.loads(save_path.read_text(encoding="utf-8"))
+
+        assert saved["schema_version"] == "1.1.0"
+        assert len(saved["scenario_sha256"]) == 64
+        assert saved["scenario_ref"] == str(scenario_path.resolve())
+        assert "scenario_data" not in saved
+        assert saved["consumed_hidden_locations"] == ["hall"]
+
+        loaded = load_play_state(save_path)
+        assert loaded["scenario_data"]["locations"]["study"]["props"] == ["desk"]
+        assert loaded["scenario_path"] == str(scenario_path.resolve())
+
+        output, _ = execute_command({"action": "search", "target": None}, loaded)
+        assert "何も見つかりませんでした" in output
+
+    @staticmethod
+    def _save_from_scenario_file(tmp_path):
+        """Load a scenario from a relative path and save it; return both paths."""
+        from scripts.play_mode import load_scenario_for_play, save_play_state
+
+        scenario_path = tmp_path / "scenario.json"
+        scenario_path.write_text(
+            json.dumps(
+                {
+                    "name": "ref_test",
+                    "locations": {"hall": {"props": ["rug"], "exits": []}},
+                    "characters": {"やな": {"location": "hall"}},
+                }
+            ),
+            encoding="utf-8",
+        )
+        state = load_scenario_for_play(Path(scenario_path.name))
+        return scenario_path, save_play_state(state, tmp_path / "state.json")
+
+    def test_reference_save_loads_from_other_directory(self, tmp_path, monkeypatch):
+        """Scenario references are absolute, not relative to the save's cwd."""
+        from scripts.play_mode import load_play_state
+
+        monkeypatch.chdir(tmp_path)
+        _, save_path = self._save_from_scenario_file(tmp_path)
+        other_dir = tmp_path / "elsewhere"
+        other_dir.mkdir()
+        monkeypatch.chdir(other_dir)
+
+        assert load_play_state(save_path)["available_objects"] == ["rug"]
+
+    def test_load_missing_scenario_reports_scenario(self, tmp_path, monkeypatch):
+        """A missing referenced scenario is reported as such, not as a missing save."""
+        from scripts.play_mode import execute_command, load_play_state, ScenarioReferenceError
+
+        monkeypatch.chdir(tmp_path)
+        scenario_path, save_path = self._save_from_scenario_file(tmp_path)
+        scenario_path.unlink()
+
+        with pytest.raises(ScenarioReferenceError, match="not found"):
+            load_play_state(save_path)
+
+        output, _ = execute_command({"action": "load", "target": str(save_path)}, {})
+        assert "シナリオを読み込めません" in output
+
+    def test_load_changed_scenario_is_refused(self, tmp_path, monkeypatch):
+        """Editing the scenario after saving makes the reference save invalid."""
+        from scripts.play_mode import load_play_state, ScenarioReferenceError
+
+        monkeypatch.chdir(tmp_path)
+        scenario_path, save_path = self._save_from_scenario_file(tmp_path)
+        scenario_path.write_text(
+            json.dumps(
+                {
+                    "name": "ref_test",
+                    "locations": {"hall": {"props": ["rug", "vase"], "exits": []}},
+                    "characters": {"やな": {"location": "hall"}},
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        with pytest.raises(ScenarioReferenceError, match="changed"):
+            load_play_state(save_path)
+
+    def test_save_after_scenario_edit_embeds_loaded_scenario(self, tmp_path, monkeypatch):
+        """A scenario edited after loading must not leak into the session's save."""
+        from scripts.play_mode import load_play_state, save_play_state
+
+        monkeypatch.chdir(tmp_path)
+        scenario_path, save_path = self._save_from_scenario_file(tmp_path)
+        state = load_play_state(save_path)
+        scenario_path.write_text(
+            json.dumps(
+                {
+                    "name": "ref_test",
+                    "locations": {"hall": {"props": ["rug", "vase"], "exits": []}},
+                    "characters": {"やな": {"location": "hall"}},
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        save_play_state(state, save_path)
+        saved = json.loads(save_path.read_text(encoding="utf-8"))
+
+        assert saved["schema_version"] == "1.0.0"
+        assert "scenario_ref" not in saved
+        assert load_play_state(save_path)["available_objects"] == ["rug"]
+
+    def test_mutating_loaded_state_keeps_cached_scenario(self, tmp_path):
+        """Lists on a loaded or moved state must not alias the cached scenario."""
+        from scripts.play_mode import (
+            execute_command,
+            load_play_state,
+            load_scenario_for_play,
+            save_play_state,
+        )
+
+        scenario_path = tmp_path / "scenario.json"
+        scenario_path.write_text(
+            json.dumps(
+                {
+                    "name": "alias_test",
+                    "locations": {
+                        "hall": {"props": ["rug"], "exits": ["study"]},
+                        "study": {"props": ["desk"], "exits": ["hall"]},
+                    },
+                    "characters": {"やな": {"location": "hall"}},
+                }
+            ),
+            encoding="utf-8",
+        )
+        save_path = save_play_state(
+            load_scenario_for_play(scenario_path), tmp_path / "state.json"
+        )
+
+        loaded = load_play_state(save_path)
+        loaded["available_objects"].append("ghost")
+        loaded["available_exits"].append("nowhere")
+        reloaded = load_play_state(save_path)
+        assert reloaded["available_objects"] == ["rug"]
+        assert reloaded["available_exits"] == ["study"]
+
+        _, moved = execute_command({"action": "move", "target": "study"}, reloaded)
+        assert moved["current_location"] == "study"
+        moved["available_objects"].append("ghost")
+        _, moved_again = execute_command({"action": "move", "target": "study"}, reloaded)
+        assert moved_again["available_objects"] == ["desk"]
+
+    def test_load_shares_cached_scenario_data(self, tmp_path):
+        """A save/load round trip should reuse the cached scenario data."""
+        from scripts.play_mode import load_play_state, load_scenario_for_play, save_play_state
+
+        scenario_path = tmp_path / "scenario.json"
+        scenario_path.write_text(
+            json.dumps(
+                {
+                    "name": "share_test",
+                    "locations": {"hall": {"props": ["rug"], "exits": []}},
+                    "characters": {"やな": {"location": "hall"}},
+                }
+            ),
+            encoding="utf-8",
+        )
+        state = load_scenario_for_play(scenario_path)
+
+        loaded = load_play_state(save_play_state(state, tmp_path / "state.json"))
+
+        assert loaded["scenario_data"] is state["scenario_data"]
+
 
 # =============================================================================
 # P1: BUG-002 Alias Expansion Tests